@@ -1,6 +1,6 @@
 /* LSystem.i */
 // Name of the module should match the project name
-%module LSystem
+%module(threads="1") LSystem
 
 // Includes so SWIG knows how to handle some of the types in the C++ standard library.
 %include "carrays.i"
@@ -24,11 +24,189 @@
 // Define relationships between C++ data and Python data.
 namespace std {
 	%template(VecFloat) vector<float>;
+	%template(VecUInt) vector<unsigned int>;
+	%template(VecInt) vector<int>;
 
 	// In Python, use VectorPyBranch for a vector<vector<float> >
 	%template(VectorPyBranch) vector<vector<float> >;
 }
 
+%{
+// Wraps a vector owned by the LSystem as a read-only Python buffer, without
+// copying, so numpy.frombuffer can view it directly. The buffer is only
+// valid until the vector is refilled.
+template <class T>
+static PyObject* LSystem_BufferView(const std::vector<T>& values) {
+	static T empty = T();
+	T* data = values.empty()? &empty : const_cast<T*>(&values[0]);
+	Py_ssize_t size = (Py_ssize_t) (values.size() * sizeof(T));
+#if PY_VERSION_HEX >= 0x03030000
+	return PyMemoryView_FromMemory((char*) data, size, PyBUF_READ);
+#else
+	return PyBuffer_FromMemory((void*) data, size);
+#endif
+}
+
+static PyObject* LSystem_FloatBufferView(const std::vector<float>& values) {
+	return LSystem_BufferView(values);
+}
+
+// Read access to the float32 data of a contiguous buffer, such as a NumPy
+// array, without copying it
+struct LSystem_FloatInput {
+	const float* data;
+	Py_ssize_t count;
+#if PY_VERSION_HEX >= 0x02060000
+	Py_buffer view;
+#endif
+};
+
+// The new buffer protocol (Python 2.6 and up, so Maya's Python 2 too)
+// reports the element format, so any other dtype is refused instead of
+// being read as float32
+static bool LSystem_GetFloatInput(PyObject* obj, LSystem_FloatInput& input) {
+#if PY_VERSION_HEX >= 0x02060000
+	if (PyObject_GetBuffer(obj, &input.view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) return false;
+	if (input.view.format == NULL || strcmp(input.view.format, "f") != 0) {
+		PyBuffer_Release(&input.view);
+		PyErr_SetString(PyExc_TypeError, "expected a float32 buffer");
+		return false;
+	}
+	if (input.view.len % (Py_ssize_t) sizeof(float) != 0) {
+		PyBuffer_Release(&input.view);
+		PyErr_SetString(PyExc_ValueError, "buffer size is not a whole number of floats");
+		return false;
+	}
+	input.data = (const float*) input.view.buf;
+	input.count = input.view.len / (Py_ssize_t) sizeof(float);
+#else
+	const void* data;
+	Py_ssize_t size;
+	if (PyObject_AsReadBuffer(obj, &data, &size) != 0) return false;
+	if (size % (Py_ssize_t) sizeof(float) != 0) {
+		PyErr_SetString(PyExc_ValueError, "buffer size is not a whole number of floats");
+		return false;
+	}
+	input.data = (const float*) data;
+	input.count = size / (Py_ssize_t) sizeof(float);
+#endif
+	return true;
+}
+
+static void LSystem_ReleaseFloatInput(LSystem_FloatInput& input) {
+#if PY_VERSION_HEX >= 0x02060000
+	PyBuffer_Release(&input.view);
+#endif
+}
+%}
+
+// Python passes bud buffers through setOptimalBudBuffers below
+%ignore LSystem::setOptimalBudData;
+
+// The GIL is held by default and released only around the heavy native
+// calls, which touch nothing but their own LSystem. Python threads can then
+// run different LSystem instances at the same time.
+%nothread;
+%thread LSystem::loadProgramFromString;
+%thread LSystem::getIteration;
+%thread LSystem::processPy;
+%thread LSystem::processBuffers;
+%thread LSystem::processInstanced;
+%thread LSystem::flattenInstances;
+%thread LSystem::updateBudGeometry;
+%thread LSystem::updateBudBuffers;
+%thread LSystem::processBatch;
+
 %include "LSystem.h"
 %include "vec.h"
 %include "matrix.h"
+
+%extend LSystem {
+	// Zero-copy views of the buffers filled by processBuffers()
+	PyObject* getBranchBufferView() {
+		return LSystem_FloatBufferView($self->getBranchBuffer());
+	}
+	PyObject* getFlowerBufferView() {
+		return LSystem_FloatBufferView($self->getFlowerBuffer());
+	}
+
+	// Zero-copy view of the bounds from the last turtle pass
+	PyObject* getBoundsBufferView() {
+		return LSystem_FloatBufferView($self->getBoundsBuffer());
+	}
+
+	// Zero-copy int32 views of the topology from the last turtle pass
+	PyObject* getBranchParentsView() {
+		return LSystem_BufferView($self->getBranchParents());
+	}
+	PyObject* getBranchDepthsView() {
+		return LSystem_BufferView($self->getBranchDepths());
+	}
+	PyObject* getBranchOrdersView() {
+		return LSystem_BufferView($self->getBranchOrders());
+	}
+
+	// Zero-copy views of the templates filled by processInstanced()
+	PyObject* getTemplateBranchesView(unsigned int id) {
+		return LSystem_FloatBufferView($self->getTemplateBranches(id));
+	}
+	PyObject* getTemplateFlowersView(unsigned int id) {
+		return LSystem_FloatBufferView($self->getTemplateFlowers(id));
+	}
+	PyObject* getTemplateInstanceFramesView(unsigned int id) {
+		return LSystem_FloatBufferView($self->getTemplateInstanceFrames(id));
+	}
+
+	// Sets the buds from float32 buffers of 3 * count positions, 3 * count
+	// directions and count angles, e.g. NumPy arrays
+	PyObject* setOptimalBudBuffers(PyObject* buds, PyObject* dirs, PyObject* angles) {
+		LSystem_FloatInput b, d, a;
+		if (!LSystem_GetFloatInput(buds, b)) return NULL;
+		if (!LSystem_GetFloatInput(dirs, d)) {
+			LSystem_ReleaseFloatInput(b);
+			return NULL;
+		}
+		if (!LSystem_GetFloatInput(angles, a)) {
+			LSystem_ReleaseFloatInput(b);
+			LSystem_ReleaseFloatInput(d);
+			return NULL;
+		}
+
+		bool sized = (b.count == 3 * a.count && d.count == 3 * a.count);
+		if (sized) {
+			$self->setOptimalBudData(b.data, d.data, a.data, (unsigned int) a.count);
+		}
+		LSystem_ReleaseFloatInput(b);
+		LSystem_ReleaseFloatInput(d);
+		LSystem_ReleaseFloatInput(a);
+		if (!sized) {
+			PyErr_SetString(PyExc_ValueError, "expected 3 floats per bud and direction and 1 per angle");
+			return NULL;
+		}
+		Py_RETURN_NONE;
+	}
+
+	// Zero-copy views of the buffers filled by processBatch()
+	PyObject* getBatchBranchBufferView() {
+		return LSystem_FloatBufferView($self->getBatchBranchBuffer());
+	}
+	PyObject* getBatchFlowerBufferView() {
+		return LSystem_FloatBufferView($self->getBatchFlowerBuffer());
+	}
+
+	// Zero-copy view of the branches grown by updateBudBuffers()
+	PyObject* getBudBranchBufferView() {
+		return LSystem_FloatBufferView($self->getBudBranchBuffer());
+	}
+
+	// Zero-copy views of the stored buds
+	PyObject* getBudPositionView() {
+		return LSystem_FloatBufferView($self->getBudPositionBuffer());
+	}
+	PyObject* getBudDirView() {
+		return LSystem_FloatBufferView($self->getBudDirBuffer());
+	}
+	PyObject* getBudAngleView() {
+		return LSystem_FloatBufferView($self->getBudAngleBuffer());
+	}
+}
@@ -1,155 +1,591 @@
-#include "LSystem.h"    
+// Standard headers go first: matrix.h (through LSystem.h) defines min and
+// max as macros, which break the std headers included after it
 #include <fstream>
+#include <algorithm>
+#include <cfloat>
+#include <climits>
+#include <stdexcept>
 #include <stack>
+#include "LSystem.h"
+#include "Quaternion.h"
 
 #pragma warning(disable : 4244)
 #pragma warning(disable : 4290)
 #include "matrix.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 #define Rad2Deg 57.295779513082320876798154814105
 #define Deg2Rad 0.017453292519943295769236907684886
 
-LSystem::LSystem() : mDfltAngle(22.5), mDfltStep(1.0)
-{
+const vec3 UP_AXIS = vec3(0,1,0);
+const vec3 LEFT_AXIS = vec3(1,0,0);
+const vec3 FORWARD_AXIS = vec3(0,0,1);
+
+// Default distance within which a position matches a bud
+const float DEFAULT_BUD_TOLERANCE = 1e-4f;
+
+// Smallest cell of the bud hash, so a zero tolerance still quantizes
+const float MIN_BUD_CELL = 1e-6f;
+
+// Bud cell indices are clamped to this magnitude, well inside a long long,
+// so coordinates far beyond the cell size still quantize without overflow
+const double MAX_BUD_CELL_INDEX = 1e15;
+
+// Default byte budget of the iteration cache
+const size_t DEFAULT_ITERATION_CACHE_BUDGET = 128 * 1024 * 1024;
+
+// Derivations shorter than this are not worth splitting across threads
+const size_t PARALLEL_MIN_SYMBOLS = 64 * 1024;
+
+// Segments handed out per thread, so uneven subtrees still balance
+const size_t SEGMENTS_PER_THREAD = 8;
+
+// Fewer buds than this grow on the calling thread
+const int PARALLEL_MIN_BUDS = 1024;
+
+// Predicted counts above this are not reserved for; the allocation would
+// fail anyway
+const size_t MAX_RESERVE = ((size_t) -1) / 64;
+
+
+
+
+LSystem::LSystem() : mDfltAngle(22.5), mDfltStep(1.0) {
+	mHasResources = false;
+	mGrammarFromString = false;
+	mBudTolerance = DEFAULT_BUD_TOLERANCE;
+	mStreaming = false;
+	mThreads = 0;
+	setSeed(0);
+	mCacheBudget = DEFAULT_ITERATION_CACHE_BUDGET;
+	mCacheBytes = 0;
+	mCacheClock = 0;
+	mCacheHits = 0;
+	mCacheMisses = 0;
+	compile();
 }
 
-void LSystem::setDefaultAngle(float degrees)
-{
+void LSystem::setDefaultAngle(float degrees) {
     mDfltAngle = degrees;
 }
 
-void LSystem::setDefaultStep(float distance)
-{
+void LSystem::setDefaultStep(float distance) {
     mDfltStep = distance;
 }
 
-float LSystem::getDefaultAngle() const
-{
+float LSystem::getDefaultAngle() const {
     return mDfltAngle;
 }
 
-float LSystem::getDefaultStep() const
-{
+float LSystem::getDefaultStep() const {
     return mDfltStep;
 }
 
-const std::string& LSystem::getGrammarString() const
-{
+const std::string& LSystem::getGrammarString() const {
     return mGrammar;
 }
 
-void LSystem::reset()
-{
+void LSystem::setStreaming(bool streaming) {
+    mStreaming = streaming;
+}
+
+bool LSystem::getStreaming() const {
+    return mStreaming;
+}
+
+void LSystem::setThreads(unsigned int threads) {
+    mThreads = threads;
+}
+
+unsigned int LSystem::getThreads() const {
+    return mThreads;
+}
+
+void LSystem::setSeed(unsigned int seed) {
+    mSeed = seed;
+    mRandom.seed(seed);
+}
+
+unsigned int LSystem::getSeed() const {
+    return mSeed;
+}
+
+LSystem::Random::Random(unsigned int seed) {
+    this->seed(seed);
+}
+
+/**
+ * Fills the state from the seed with a Weyl sequence through the murmur3
+ * finalizer, which never yields an all zero state
+ **/
+void LSystem::Random::seed(unsigned int seed) {
+    unsigned int x = seed;
+    for (int i = 0; i < 4; i++) {
+        unsigned int z = (x += 0x9e3779b9u);
+        z = (z ^ (z >> 16)) * 0x85ebca6bu;
+        z = (z ^ (z >> 13)) * 0xc2b2ae35u;
+        mState[i] = z ^ (z >> 16);
+    }
+}
+
+unsigned int LSystem::Random::next() {
+    unsigned int* s = mState;
+    unsigned int x = s[1] * 5;
+    unsigned int result = ((x << 7) | (x >> 25)) * 9;
+    unsigned int t = s[1] << 9;
+    s[2] ^= s[0];
+    s[3] ^= s[1];
+    s[1] ^= s[2];
+    s[0] ^= s[3];
+    s[2] ^= t;
+    s[3] = (s[3] << 11) | (s[3] >> 21);
+    return result;
+}
+
+/**
+ * Seeds one of many independent streams of a seed. Distinct streams of the
+ * same seed always start from distinct states.
+ **/
+void LSystem::Random::seed(unsigned int seed, unsigned int stream) {
+    this->seed(seed ^ (stream * 0x9e3779b9u + 0x7f4a7c15u));
+}
+
+unsigned int LSystem::Random::nextInt(unsigned int bound) {
+    return next() % bound;
+}
+
+void LSystem::reset() {
+    mGrammar = "";
+    mGrammarFromString = false;
     current = "";
     iterations.clear();
+    mCacheBytes = 0;
     productions.clear();
 }
 
-const std::string& LSystem::getIteration(unsigned int n)
-{
-    if (n >= iterations.size())
-    {
-        for (unsigned int i = iterations.size(); i <= n; i++)
-        {
-            current = iterate(current);
-            iterations.push_back(current);
-        }        
+const std::string& LSystem::getIteration(unsigned int n) {
+    std::map<unsigned int, CachedIteration>::iterator it = iterations.find(n);
+    if (it != iterations.end()) {
+        mCacheHits++;
+        it->second.lastUse = ++mCacheClock;
+        return it->second.symbols;
+    }
+    mCacheMisses++;
+
+    // Re-derive from the nearest kept checkpoint below n, or from the axiom
+    const std::string* input = &current;
+    unsigned int first = 0;
+    it = iterations.lower_bound(n);
+    if (it != iterations.begin()) {
+        --it;
+        input = &it->second.symbols;
+        first = it->first + 1;
+    }
+
+    // The length of every derivation is known up front, so each one is
+    // written into an exactly sized buffer
+    std::vector<unsigned long long> counts, lengths;
+    predictCounts(n, counts, &lengths);
+    if (lengths[n] > std::string().max_size()) throw std::length_error("derivation too long");
+
+    // Every intermediate derivation is offered to the cache as a checkpoint
+    CachedIteration* entry = NULL;
+    for (unsigned int i = first; i <= n; i++) {
+        std::string next = iterate(*input, (size_t) lengths[i]);
+        entry = &iterations[i];
+        entry->symbols.swap(next);
+        entry->lastUse = ++mCacheClock;
+        mCacheBytes += entry->symbols.size();
+        evictIterations(i);
+        input = &entry->symbols;
+    }
+    return entry->symbols;
+}
+
+/**
+ * Evicts the least recently used derivations, except the pinned one, until
+ * the cache fits in its byte budget
+ **/
+void LSystem::evictIterations(unsigned int pinned) {
+    while (mCacheBytes > mCacheBudget) {
+        std::map<unsigned int, CachedIteration>::iterator victim = iterations.end();
+        std::map<unsigned int, CachedIteration>::iterator it;
+        for (it = iterations.begin(); it != iterations.end(); ++it) {
+            if (it->first == pinned) continue;
+            if (victim == iterations.end() || it->second.lastUse < victim->second.lastUse) {
+                victim = it;
+            }
+        }
+        if (victim == iterations.end()) break;
+        mCacheBytes -= victim->second.symbols.size();
+        iterations.erase(victim);
+    }
+}
+
+void LSystem::setIterationCacheBudget(size_t bytes) {
+    mCacheBudget = bytes;
+    if (!iterations.empty()) {
+        // Keep the most recently used derivation whatever the budget
+        std::map<unsigned int, CachedIteration>::iterator newest = iterations.begin();
+        std::map<unsigned int, CachedIteration>::iterator it;
+        for (it = iterations.begin(); it != iterations.end(); ++it) {
+            if (it->second.lastUse > newest->second.lastUse) newest = it;
+        }
+        evictIterations(newest->first);
+    }
+}
+
+size_t LSystem::getIterationCacheBudget() const {
+    return mCacheBudget;
+}
+
+size_t LSystem::getIterationCacheBytes() const {
+    return mCacheBytes;
+}
+
+unsigned int LSystem::getIterationCacheHits() const {
+    return mCacheHits;
+}
+
+unsigned int LSystem::getIterationCacheMisses() const {
+    return mCacheMisses;
+}
+
+void LSystem::resetIterationCacheStats() {
+    mCacheHits = 0;
+    mCacheMisses = 0;
+}
+
+static unsigned long long addCounts(unsigned long long a, unsigned long long b) {
+    return (a > ULLONG_MAX - b)? ULLONG_MAX : a + b;
+}
+
+static unsigned long long multiplyCounts(unsigned long long a, unsigned long long b) {
+    return (b != 0 && a > ULLONG_MAX / b)? ULLONG_MAX : a * b;
+}
+
+static size_t reserveSize(unsigned long long count) {
+    return (count <= MAX_RESERVE)? (size_t) count : 0;
+}
+
+/**
+ * Steps the symbol counts of the axiom through the production count matrix,
+ * stored sparsely as the (symbol, count) pairs of every rule
+ **/
+void LSystem::predictCounts(unsigned int n, std::vector<unsigned long long>& counts,
+    std::vector<unsigned long long>* lengths) const {
+    std::vector<std::pair<Symbol, unsigned long long> > produced[256];
+    for (unsigned int s = 0; s < 256; s++) {
+        const Rule& rule = mRules[s];
+        if (!rule.defined) continue;
+        unsigned long long histogram[256] = {0};
+        for (unsigned int i = 0; i < rule.length; i++) {
+            histogram[mRuleSymbols[rule.start + i]]++;
+        }
+        for (unsigned int t = 0; t < 256; t++) {
+            if (histogram[t] > 0) produced[s].push_back(std::make_pair((Symbol) t, histogram[t]));
+        }
+    }
+
+    counts.assign(256, 0);
+    for (size_t i = 0; i < mAxiom.size(); i++) {
+        counts[mAxiom[i]]++;
     }
-    return iterations[n];
+    if (lengths) lengths->assign(n + 1, 0);
+
+    std::vector<unsigned long long> next(256);
+    for (unsigned int i = 0; i <= n; i++) {
+        std::fill(next.begin(), next.end(), 0);
+        for (unsigned int s = 0; s < 256; s++) {
+            if (counts[s] == 0) continue;
+            if (!mRules[s].defined) {
+                next[s] = addCounts(next[s], counts[s]);
+                continue;
+            }
+            for (size_t j = 0; j < produced[s].size(); j++) {
+                unsigned long long& count = next[produced[s][j].first];
+                count = addCounts(count, multiplyCounts(counts[s], produced[s][j].second));
+            }
+        }
+        counts.swap(next);
+
+        if (lengths) {
+            unsigned long long length = 0;
+            for (unsigned int s = 0; s < 256; s++) {
+                length = addCounts(length, counts[s]);
+            }
+            (*lengths)[i] = length;
+        }
+    }
+}
+
+unsigned long long LSystem::predictLength(unsigned int n) const {
+    std::vector<unsigned long long> counts, lengths;
+    predictCounts(n, counts, &lengths);
+    return lengths[n];
+}
+
+unsigned long long LSystem::predictSymbolCount(unsigned int n, Symbol symbol) const {
+    std::vector<unsigned long long> counts;
+    predictCounts(n, counts);
+    return counts[symbol];
 }
 
-void LSystem::loadProgram(const std::string& fileName)
-{
+unsigned long long LSystem::predictBranchCount(unsigned int n) const {
+    return predictSymbolCount(n, 'F');
+}
+
+unsigned long long LSystem::predictBracketCount(unsigned int n) const {
+    return predictSymbolCount(n, '[');
+}
+
+unsigned long long LSystem::predictFlowerCount(unsigned int n) const {
+    return predictSymbolCount(n, '*');
+}
+
+/**
+ * Extends mExpansionLengths row by row: a symbol is one symbol long after
+ * no rewrites or without a rule, else as long as its successor one rewrite
+ * shallower
+ **/
+void LSystem::buildExpansionLengths(unsigned int depth) {
+    unsigned int rows = (unsigned int) (mExpansionLengths.size() / 256);
+    if (rows > depth) return;
+    mExpansionLengths.resize(256 * (depth + 1));
+    for (unsigned int d = rows; d <= depth; d++) {
+        unsigned long long* row = &mExpansionLengths[256 * d];
+        for (unsigned int s = 0; s < 256; s++) {
+            const Rule& rule = mRules[s];
+            if (d == 0 || !rule.defined) {
+                row[s] = 1;
+                continue;
+            }
+            const unsigned long long* below = row - 256;
+            unsigned long long length = 0;
+            for (unsigned int i = 0; i < rule.length; i++) {
+                length = addCounts(length, below[mRuleSymbols[rule.start + i]]);
+            }
+            row[s] = length;
+        }
+    }
+}
+
+LSystem::Symbol LSystem::getDerivationSymbol(unsigned int n, unsigned long long index) {
+    buildExpansionLengths(n + 1);
+    DerivationCursor cursor(*this, n);
+    cursor.seek(index);
+    Symbol sym = 0;
+    cursor.next(sym);
+    return sym;
+}
+
+std::string LSystem::getDerivationSlice(unsigned int n, unsigned long long begin, unsigned int count) {
+    buildExpansionLengths(n + 1);
+    DerivationCursor cursor(*this, n);
+    cursor.seek(begin);
+
+    std::string slice;
+    slice.reserve(count);
+    Symbol sym;
+    while (slice.size() < count && cursor.next(sym)) {
+        slice.push_back((char) sym);
+    }
+    return slice;
+}
+
+void LSystem::loadProgram(const std::string& fileName) {
     reset();
 
     std::string line;
     std::ifstream file(fileName.c_str());
-    if (file.is_open())
-    {
-        while (file.good())
-        {
+    if (file.is_open()) {
+        while (file.good()) {
             getline(file,line);
             addProduction(line);
         }
     }
     // for each line in p, add production
     file.close();
+    compile();
 }
 
-void LSystem::loadProgramFromString(const std::string& program)
-{
-    reset(); 
+void LSystem::loadProgramFromString(const std::string& program) {
+    // The derivations only depend on the grammar, so an unchanged grammar
+    // keeps its cached iterations when just the angle or step changed. Only
+    // a grammar loaded from a string counts: mGrammar stays empty for a
+    // fresh LSystem and after loadProgram.
+    if (mGrammarFromString && program == mGrammar) return;
+
+    reset();
     mGrammar = program;
+    mGrammarFromString = true;
 
     size_t index = 0;
-    while (index < program.size())
-    {
+    while (index < program.size()) {
         size_t nextIndex = program.find("\n", index);
         std::string line = program.substr(index, nextIndex);
         addProduction(line);
         if (nextIndex == std::string::npos) break;
         index = nextIndex+1;
     }
+    compile();
 }
 
-void LSystem::addProduction(std::string line)
-{
+void LSystem::addProduction(std::string line) {
     size_t index;
 
     // 1. Strip whitespace
-    while ((index = line.find(" ")) != std::string::npos)
-    {
-        line.replace(index, 1, ""); 
+    while ((index = line.find(" ")) != std::string::npos) {
+        line.replace(index, 1, "");
     }
 
     if (line.size() == 0) return;
 
     // 2. Split productions
     index = line.find("->");
-    if (index != std::string::npos)
-    {
+    if (index != std::string::npos) {
         std::string symFrom = line.substr(0, index);
         std::string symTo = line.substr(index+2);
         productions[symFrom] = symTo;
-    }
-    else  // assume its the start sym
-    {
+    } else { 
+		// assume its the start sym
         current = line;
     }
 }
 
-std::string LSystem::iterate(const std::string& input)
-{
-    std::string output = "";
-    for (unsigned int i = 0; i < input.size(); i++)
-    {
-        std::string sym = input.substr(i,1);
-        std::string next = productions.count(sym) > 0? productions[sym] : sym; 
-        output = output + next;
+/**
+ * Compiles the productions and the start symbol into symbol buffers and
+ * builds the turtle dispatch table
+ **/
+void LSystem::compile() {
+    mAxiom.assign(current.begin(), current.end());
+    mRuleSymbols.clear();
+    mExpansionLengths.clear();
+    for (unsigned int i = 0; i < 256; i++) {
+        mRules[i].start = 0;
+        mRules[i].length = 0;
+        mRules[i].defined = false;
+        mOps[i] = OP_MODEL;
+    }
+
+    // Only single symbol predecessors can ever match while rewriting
+    std::map<std::string, std::string>::const_iterator it;
+    for (it = productions.begin(); it != productions.end(); ++it) {
+        if (it->first.size() != 1) continue;
+        Rule& rule = mRules[(Symbol) it->first[0]];
+        rule.start = mRuleSymbols.size();
+        rule.length = it->second.size();
+        rule.defined = true;
+        mRuleSymbols.insert(mRuleSymbols.end(), it->second.begin(), it->second.end());
+    }
+
+    mOps[(Symbol) 'F'] = OP_DRAW;
+    mOps[(Symbol) 'f'] = OP_MOVE;
+    mOps[(Symbol) '+'] = OP_UP_POS;
+    mOps[(Symbol) '-'] = OP_UP_NEG;
+    mOps[(Symbol) '&'] = OP_LEFT_POS;
+    mOps[(Symbol) '^'] = OP_LEFT_NEG;
+    mOps[(Symbol) '\\'] = OP_FORWARD_POS;
+    mOps[(Symbol) '/'] = OP_FORWARD_NEG;
+    mOps[(Symbol) '|'] = OP_TURN_AROUND;
+    mOps[(Symbol) '['] = OP_PUSH;
+    mOps[(Symbol) ']'] = OP_POP;
+}
+
+/**
+ * Rewrites every symbol of input into an output of the given size. Large
+ * inputs are split into chunks, and each chunk writes its replacements at
+ * the prefix sum of the rewritten lengths of the chunks before it.
+ **/
+std::string LSystem::iterate(const std::string& input, size_t size) {
+    std::string output(size, '\0');
+    if (size == 0) return output;
+
+    unsigned int threads = workerThreads();
+    if (threads < 2 || input.size() < PARALLEL_MIN_SYMBOLS) {
+        rewrite(input, 0, input.size(), &output[0]);
+        return output;
+    }
+
+    int chunks = (int) (threads * SEGMENTS_PER_THREAD);
+    size_t chunkLength = input.size() / chunks + 1;
+    std::vector<size_t> offsets(chunks + 1, 0);
+#pragma omp parallel for num_threads(threads)
+    for (int c = 0; c < chunks; c++) {
+        size_t begin = MIN(c * chunkLength, input.size());
+        size_t end = MIN(begin + chunkLength, input.size());
+        offsets[c + 1] = rewrittenLength(input, begin, end);
+    }
+    for (int c = 0; c < chunks; c++) {
+        offsets[c + 1] += offsets[c];
+    }
+
+    char* out = &output[0];
+#pragma omp parallel for schedule(dynamic) num_threads(threads)
+    for (int c = 0; c < chunks; c++) {
+        size_t begin = MIN(c * chunkLength, input.size());
+        size_t end = MIN(begin + chunkLength, input.size());
+        rewrite(input, begin, end, out + offsets[c]);
     }
     return output;
-    //for each sym in current state, replace the sym
+}
+
+size_t LSystem::rewrittenLength(const std::string& input, size_t begin, size_t end) const {
+    size_t length = 0;
+    for (size_t i = begin; i < end; i++) {
+        const Rule& rule = mRules[(Symbol) input[i]];
+        length += rule.defined? rule.length : 1;
+    }
+    return length;
+}
+
+/**
+ * Writes the replacements of input[begin, end) from out on, and returns the
+ * end of what was written
+ **/
+char* LSystem::rewrite(const std::string& input, size_t begin, size_t end, char* out) const {
+    for (size_t i = begin; i < end; i++) {
+        const Rule& rule = mRules[(Symbol) input[i]];
+        if (rule.defined) {
+            std::vector<Symbol>::const_iterator symbols = mRuleSymbols.begin() + rule.start;
+            out = std::copy(symbols, symbols + rule.length, out);
+        } else {
+            *out++ = input[i];
+        }
+    }
+    return out;
+}
+
+/**
+ * Threads the parallel passes use: every core when mThreads is 0, and only
+ * the calling thread without OpenMP
+ **/
+unsigned int LSystem::workerThreads() const {
+#ifdef _OPENMP
+    return (mThreads == 0)? omp_get_max_threads() : mThreads;
+#else
+    return 1;
+#endif
 }
 
 
 LSystem::Turtle::Turtle() :
     pos(0,0,0),
-    up(0,0,1),
-    forward(1,0,0),
-    left(0,1,0)
-{
+    up(UP_AXIS),
+    forward(FORWARD_AXIS),
+    left(LEFT_AXIS) {
 }
 
-LSystem::Turtle::Turtle(const LSystem::Turtle& t)
-{
+LSystem::Turtle::Turtle(const LSystem::Turtle& t) {
     pos = t.pos;
     up = t.up;
     forward = t.forward;
     left = t.left;
 }
 
-LSystem::Turtle& LSystem::Turtle::operator=(const LSystem::Turtle& t)
-{
+LSystem::Turtle& LSystem::Turtle::operator=(const LSystem::Turtle& t) {
     if (&t == this) return *this;
 
     pos = t.pos;
@@ -159,60 +595,117 @@ LSystem::Turtle& LSystem::Turtle::operator=(const LSystem::Turtle& t)
     return *this;
 }
 
-void LSystem::Turtle::moveForward(float length)
-{
+void LSystem::Turtle::moveForward(float length) {
     pos = pos + length * forward;
 }
 
-void LSystem::Turtle::applyUpRot(float degrees)
-{
-    math::RotationMatrix<float> mat(2,Deg2Rad*degrees); // Z axis
-    math::RotationMatrix<float> world2local(forward, left, up); 
-    up =  world2local * mat * vec3(0,0,1);
-    left = world2local * mat * vec3(0,1,0);
-    forward = world2local * mat * vec3(1,0,0);
+
+void LSystem::Turtle::applyUpRot(float degrees) {
+    applyRotation(Rotation(2, degrees)); // Z axis
+}
+
+void LSystem::Turtle::applyLeftRot(float degrees) {
+    applyRotation(Rotation(1, degrees)); // Y axis
+}
+
+void LSystem::Turtle::applyForwardRot(float degrees) {
+    applyRotation(Rotation(0, degrees)); // X axis
+}
+
+/**
+ * Same as world2local * mat * axis with world2local built from the
+ * (forward, left, up) columns, written out on the frame vectors
+ **/
+static void rotateFrame(const double (*m)[3], vec3& forward, vec3& left, vec3& up) {
+    const double* f = forward.n;
+    const double* l = left.n;
+    const double* u = up.n;
+    vec3 newLeft(
+        f[0]*m[0][0] + l[0]*m[1][0] + u[0]*m[2][0],
+        f[1]*m[0][0] + l[1]*m[1][0] + u[1]*m[2][0],
+        f[2]*m[0][0] + l[2]*m[1][0] + u[2]*m[2][0]);
+    vec3 newUp(
+        f[0]*m[0][1] + l[0]*m[1][1] + u[0]*m[2][1],
+        f[1]*m[0][1] + l[1]*m[1][1] + u[1]*m[2][1],
+        f[2]*m[0][1] + l[2]*m[1][1] + u[2]*m[2][1]);
+    vec3 newForward(
+        f[0]*m[0][2] + l[0]*m[1][2] + u[0]*m[2][2],
+        f[1]*m[0][2] + l[1]*m[1][2] + u[1]*m[2][2],
+        f[2]*m[0][2] + l[2]*m[1][2] + u[2]*m[2][2]);
+    left = newLeft;
+    up = newUp;
+    forward = newForward;
 }
 
-void LSystem::Turtle::applyLeftRot(float degrees)
-{
-    math::RotationMatrix<float> mat(1,Deg2Rad*degrees); // Y axis
-    math::RotationMatrix<float> world2local(forward, left, up); 
-    up =  world2local * mat * vec3(0,0,1);
-    left = world2local * mat * vec3(0,1,0);
-    forward = world2local * mat * vec3(1,0,0);
+void LSystem::Turtle::applyRotation(const Rotation& rot) {
+    rotateFrame(rot.m, forward, left, up);
 }
 
-void LSystem::Turtle::applyForwardRot(float degrees)
-{
-    math::RotationMatrix<float> mat(0,Deg2Rad*degrees); // X axis
-    math::RotationMatrix<float> world2local(forward, left, up); 
-    up =  world2local * mat * vec3(0,0,1);
-    left = world2local * mat * vec3(0,1,0);
-    forward = world2local * mat * vec3(1,0,0);
+vec3 LSystem::Turtle::transformPoint(const vec3& p) const {
+    return pos + transformDir(p);
 }
 
-void LSystem::process(unsigned int n, 
-    std::vector<Branch>& branches)
-{
+/**
+ * Turtle() has left, up and forward along x, y and z, so local x, y and z
+ * are amounts along this turtle's left, up and forward
+ **/
+vec3 LSystem::Turtle::transformDir(const vec3& d) const {
+    return vec3(
+        d.n[0]*left.n[0] + d.n[1]*up.n[0] + d.n[2]*forward.n[0],
+        d.n[0]*left.n[1] + d.n[1]*up.n[1] + d.n[2]*forward.n[1],
+        d.n[0]*left.n[2] + d.n[1]*up.n[2] + d.n[2]*forward.n[2]);
+}
+
+LSystem::Turtle LSystem::Turtle::transform(const Turtle& local) const {
+    Turtle t;
+    t.pos = transformPoint(local.pos);
+    t.up = transformDir(local.up);
+    t.forward = transformDir(local.forward);
+    t.left = transformDir(local.left);
+    return t;
+}
+
+LSystem::Rotation::Rotation() {
+    for (int i = 0; i < 3; i++) {
+        for (int j = 0; j < 3; j++) {
+            m[i][j] = (i == j)? 1.0 : 0.0;
+        }
+    }
+}
+
+LSystem::Rotation::Rotation(int axis, float degrees) {
+    // Same entries as math::RotationMatrix(axis, angle)
+    double c = cos(Deg2Rad*degrees);
+    double s = sin(Deg2Rad*degrees);
+    if (axis == 0) {
+        m[0][0] = 1; m[0][1] = 0; m[0][2] = 0;
+        m[1][0] = 0; m[1][1] = c; m[1][2] = -s;
+        m[2][0] = 0; m[2][1] = s; m[2][2] = c;
+    } else if (axis == 1) {
+        m[0][0] = c;  m[0][1] = 0; m[0][2] = s;
+        m[1][0] = 0;  m[1][1] = 1; m[1][2] = 0;
+        m[2][0] = -s; m[2][1] = 0; m[2][2] = c;
+    } else {
+        m[0][0] = c; m[0][1] = -s; m[0][2] = 0;
+        m[1][0] = s; m[1][1] = c;  m[1][2] = 0;
+        m[2][0] = 0; m[2][1] = 0;  m[2][2] = 1;
+    }
+}
+
+void LSystem::process(unsigned int n,
+    std::vector<Branch>& branches) {
     std::vector<Geometry> models;
     process(n,branches,models);
 }
 
-// TODO:: Finish this function.
-//        This is the function that will be called from Python to generate the branches and flowers.
-//        Notice the argument types. Since we are interfacing with Python, we must simplify the data
-//          types that we are using because Python cannot easily handle the "vec" class that is usually 
-//          used in the Branch. Instead, we will return slightly altered data packets:
-//				flowers:  vector of vector of floats: [posx, posy, poz]
-//              branches: vector of vector of floats: [startx, starty, startz, endx, endy, endz]
-//
-//         You will need to repackage the branches and flowers so that they can be passed to Python
-//           in the format described above. Notice that in the LSystem.i file, we have defined
-//           a std::vector<float> as a VecFloat in Python and a std::vector<std::vector<float> > as
-//           a VectorPyBranch in Python.
+/**				
+ * Processes the LSystem to via Python get branches and flowers
+ * flowers:  vector of vector of floats: [posx, posy, poz]
+ * branches: vector of vector of floats: [startx, starty, startz, endx, endy, endz]
+ **/
 void LSystem::processPy(unsigned int n,
-		std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers) {
-		
+	std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers) {
+
 	std::vector<Branch> preBranches;
     std::vector<Geometry> preFlowers;
 
@@ -267,79 +760,1230 @@ void LSystem::processPy(unsigned int n,
 
 }
 
-// LOOK: This is where the L-System creates the branches and the flowers.
-//        Branches are returns in the "branches" vector and flowers (or other symbols) are
-//        returned in the "models" vector.
-void LSystem::process(unsigned int n, 
-    std::vector<Branch>& branches, 
-    std::vector<Geometry>& models)
-{
-    Turtle turtle;
-    std::stack<Turtle> stack;
 
-    // Init so we're pointing up
-    turtle.applyLeftRot(-90);
+/**
+ * Processes the LSystem as processPy and also returns its bounds
+ * bounds: [minx, miny, minz, maxx, maxy, maxz] for the whole tree, then
+ *         for each subtree opened at the top level
+ **/
+void LSystem::processPy(unsigned int n,
+	std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers,
+	std::vector<std::vector<float> >& bounds) {
+	processPy(n, branches, flowers);
+	for (unsigned int i = 0; i < mBoundsBuffer.size(); i += 6) {
+		const float* b = &mBoundsBuffer[i];
+		bounds.push_back(std::vector<float>(b, b + 6));
+	}
+}
 
-    std::string insn = getIteration(n);
+/**
+ * Reseeds the random generator, then processes the LSystem as processPy
+ **/
+void LSystem::processPy(unsigned int n,
+	std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers,
+	unsigned int seed) {
+	setSeed(seed);
+	processPy(n, branches, flowers);
+}
 
-    std::vector<int> depth;
-    int curDepth = 0;
 
-    for (unsigned int i = 0; i < insn.size(); i++)
-    {
-        std::string sym = insn.substr(i,1);
-        if (sym == "F")
-        {
+void LSystem::Turtle::rotateByAxisAngle(const vec3 axis, float angle) {
+	Quaternion q;
+	q.FromAxisAngle(axis, angle * Deg2Rad); 
+	math::RotationMatrix<float> mat = q.toRotationMatrix();
+    math::RotationMatrix<float> world2local(forward, left, up);
+    //up =  world2local * mat * UP_AXIS;
+    //left = world2local * mat * LEFT_AXIS;
+    //forward = world2local * mat * FORWARD_AXIS;
+	up =  mat * UP_AXIS;
+    left = mat * LEFT_AXIS;
+    forward = mat * FORWARD_AXIS;
+}
+
+
+
+LSystem::StringCursor::StringCursor(const std::string& symbols) :
+    mSymbols(symbols),
+    mPos(0),
+    mEnd(symbols.size()) {
+}
+
+LSystem::StringCursor::StringCursor(const std::string& symbols, size_t begin, size_t end) :
+    mSymbols(symbols),
+    mPos(begin),
+    mEnd(end) {
+}
+
+bool LSystem::StringCursor::next(Symbol& sym) {
+    if (mPos >= mEnd) return false;
+    sym = mSymbols[mPos++];
+    return true;
+}
+
+LSystem::DerivationCursor::DerivationCursor(const LSystem& lsys, unsigned int n) :
+    mLSystem(lsys),
+    mDepth(n + 1) {
+    // getIteration(n) holds the axiom rewritten n+1 times
+    mStack.reserve(n + 2);
+    if (!lsys.mAxiom.empty()) {
+        Frame root = { &lsys.mAxiom[0], (unsigned int) lsys.mAxiom.size(), 0, n + 1 };
+        mStack.push_back(root);
+    }
+}
+
+/**
+ * Restarts the expansion so next() produces the symbol at index: every run
+ * skips whole expansions by their length and descends into the one holding
+ * index, leaving the stack as if all symbols before it had been read
+ **/
+void LSystem::DerivationCursor::seek(unsigned long long index) {
+    mStack.clear();
+    if (mLSystem.mAxiom.empty()) return;
+    Frame root = { &mLSystem.mAxiom[0], (unsigned int) mLSystem.mAxiom.size(), 0, mDepth };
+    mStack.push_back(root);
+
+    while (true) {
+        Frame& top = mStack.back();
+        const unsigned long long* lengths = &mLSystem.mExpansionLengths[256 * top.depth];
+        while (top.pos < top.length && index >= lengths[top.symbols[top.pos]]) {
+            index -= lengths[top.symbols[top.pos++]];
+        }
+
+        // Only the axiom can run out, when index is past the end
+        if (top.pos == top.length) {
+            mStack.clear();
+            return;
+        }
+
+        const Rule& rule = mLSystem.mRules[top.symbols[top.pos]];
+        if (top.depth == 0 || !rule.defined) return;
+        top.pos++;
+        Frame child = { &mLSystem.mRuleSymbols[rule.start], rule.length, 0, top.depth - 1 };
+        mStack.push_back(child);
+    }
+}
+
+bool LSystem::DerivationCursor::next(Symbol& sym) {
+    while (!mStack.empty()) {
+        Frame& top = mStack.back();
+        if (top.pos == top.length) {
+            mStack.pop_back();
+            continue;
+        }
+
+        Symbol s = top.symbols[top.pos++];
+        const Rule& rule = mLSystem.mRules[s];
+        if (top.depth == 0 || !rule.defined) {
+            sym = s;
+            return true;
+        }
+
+        // Descend into the successor; empty successors produce nothing
+        if (rule.length > 0) {
+            Frame child = { &mLSystem.mRuleSymbols[rule.start], rule.length, 0, top.depth - 1 };
+            mStack.push_back(child);
+        }
+    }
+    return false;
+}
+
+LSystem::GeometrySink::GeometrySink(std::vector<Branch>& branches, std::vector<Geometry>& models) :
+    mBranches(branches),
+    mModels(models) {
+}
+
+void LSystem::GeometrySink::reserve(size_t branches, size_t flowers, size_t models) {
+    mBranches.reserve(mBranches.size() + branches);
+    mModels.reserve(mModels.size() + models);
+}
+
+void LSystem::GeometrySink::addBranch(const vec3& start, const vec3& end) {
+    mBranches.push_back(Branch(start, end));
+}
+
+void LSystem::GeometrySink::addModel(const vec3& pos, Symbol sym) {
+    mModels.push_back(Geometry(pos, std::string(1, (char) sym)));
+}
+
+LSystem::BufferSink::BufferSink(std::vector<float>& branches, std::vector<float>& flowers) :
+    mBranches(branches),
+    mFlowers(flowers) {
+}
+
+void LSystem::BufferSink::reserve(size_t branches, size_t flowers, size_t models) {
+    mBranches.reserve(mBranches.size() + 6 * branches);
+    mFlowers.reserve(mFlowers.size() + 3 * flowers);
+}
+
+void LSystem::BufferSink::addBranch(const vec3& start, const vec3& end) {
+    mBranches.push_back((float) start.n[0]);
+    mBranches.push_back((float) start.n[1]);
+    mBranches.push_back((float) start.n[2]);
+    mBranches.push_back((float) end.n[0]);
+    mBranches.push_back((float) end.n[1]);
+    mBranches.push_back((float) end.n[2]);
+}
+
+void LSystem::BufferSink::addModel(const vec3& pos, Symbol sym) {
+    if (sym != '*') return;
+    mFlowers.push_back((float) pos.n[0]);
+    mFlowers.push_back((float) pos.n[1]);
+    mFlowers.push_back((float) pos.n[2]);
+}
+
+/**
+ * Builds the rotation of every turning op for the angle
+ **/
+void LSystem::buildRotations(Rotation* rotations, float angle) const {
+    rotations[OP_UP_POS] = Rotation(2, angle);
+    rotations[OP_UP_NEG] = Rotation(2, -angle);
+    rotations[OP_LEFT_POS] = Rotation(1, angle);
+    rotations[OP_LEFT_NEG] = Rotation(1, -angle);
+    rotations[OP_FORWARD_POS] = Rotation(0, angle);
+    rotations[OP_FORWARD_NEG] = Rotation(0, -angle);
+    rotations[OP_TURN_AROUND] = Rotation(2, 180);
+}
+
+/**
+ * Box helpers for (min, max) pairs. An empty box is inverted so the first
+ * point grown into it sets both corners.
+ **/
+static LSystem::Branch emptyBox() {
+    return LSystem::Branch(vec3(DBL_MAX, DBL_MAX, DBL_MAX), vec3(-DBL_MAX, -DBL_MAX, -DBL_MAX));
+}
+
+static void growBox(LSystem::Branch& box, const vec3& p) {
+    for (int i = 0; i < 3; i++) {
+        if (p.n[i] < box.first.n[i]) box.first.n[i] = p.n[i];
+        if (p.n[i] > box.second.n[i]) box.second.n[i] = p.n[i];
+    }
+}
+
+static void mergeBox(LSystem::Branch& box, const LSystem::Branch& other) {
+    growBox(box, other.first);
+    growBox(box, other.second);
+}
+
+template <class Cursor, class Sink>
+void LSystem::interpret(Cursor& cursor, Sink& sink, const TurtleSettings& settings,
+    const Segment& segment, Bounds& bounds, Topology& topology) const {
+    // The angle is fixed for the whole pass, so every rotation is built once
+    Rotation rotations[OP_POP + 1];
+    buildRotations(rotations, settings.angle);
+
+    Turtle turtle(segment.entry);
+    std::vector<Turtle> stack;
+    stack.reserve(64);
+    bounds.all = emptyBox();
+    bounds.subtrees.clear();
+
+    // Branches are numbered as they are drawn; the lineage follows the
+    // turtle through the brackets
+    Lineage lineage(segment.lineage);
+    std::vector<Lineage> lineages;
+    lineages.reserve(64);
+    int branch = segment.firstBranch;
+    topology.clear();
+
+    Symbol sym;
+    while (cursor.next(sym)) {
+        unsigned char op = mOps[sym];
+        switch (op) {
+        case OP_DRAW: {
             vec3 start = turtle.pos;
-            turtle.moveForward(mDfltStep);
-            branches.push_back(Branch(start,turtle.pos));
+            turtle.moveForward(settings.step);
+            sink.addBranch(start, turtle.pos);
+            growBox(bounds.all, start);
+            growBox(bounds.all, turtle.pos);
+            if (!stack.empty()) {
+                growBox(bounds.subtrees.back(), start);
+                growBox(bounds.subtrees.back(), turtle.pos);
+            }
+            topology.parents.push_back(lineage.parent);
+            topology.depths.push_back(lineage.depth);
+            topology.orders.push_back(lineage.order);
+            lineage.parent = branch++;
+            lineage.depth++;
+            break;
         }
-        else if (sym == "f")
-        {
-            turtle.moveForward(mDfltStep);
+        case OP_MOVE:
+            // A gap breaks the axis, so the next branch starts a new root
+            turtle.moveForward(settings.step);
+            lineage.parent = -1;
+            lineage.depth = 0;
+            break;
+        case OP_UP_POS:
+        case OP_UP_NEG:
+        case OP_LEFT_POS:
+        case OP_LEFT_NEG:
+        case OP_FORWARD_POS:
+        case OP_FORWARD_NEG:
+        case OP_TURN_AROUND:
+            turtle.applyRotation(rotations[op]);
+            break;
+        case OP_PUSH:
+            // A bracket opened at the top level starts a new subtree
+            if (stack.empty()) bounds.subtrees.push_back(emptyBox());
+            stack.push_back(turtle);
+            lineages.push_back(lineage);
+            lineage.order++;
+            break;
+        case OP_POP:
+            turtle = stack.back();
+            stack.pop_back();
+            lineage = lineages.back();
+            lineages.pop_back();
+            break;
+        default:
+            sink.addModel(turtle.pos, sym);
+            growBox(bounds.all, turtle.pos);
+            if (!stack.empty()) growBox(bounds.subtrees.back(), turtle.pos);
+            break;
         }
-        else if (sym == "+")
-        {
-            turtle.applyUpRot(mDfltAngle);
+    }
+}
+
+/**
+ * The whole derivation as one segment, from the turtle pointing up.
+ **/
+LSystem::Segment LSystem::rootSegment() const {
+    // Init so we're pointing up
+    Segment segment;
+    segment.begin = 0;
+    segment.end = 0;
+    segment.entry.applyUpRot(90);
+    segment.lineage.parent = -1;
+    segment.lineage.depth = 0;
+    segment.lineage.order = 0;
+    segment.firstBranch = 0;
+    return segment;
+}
+
+/**
+ * Splits a derivation into segments that each start at the top level, so
+ * they can be interpreted independently. Only top level symbols move the
+ * turtle here: a bracketed subtree always hands the turtle back unchanged.
+ * Returns false if a bracket closes one that was never opened.
+ **/
+bool LSystem::splitSegments(const std::string& symbols, const TurtleSettings& settings,
+    size_t minLength, std::vector<Segment>& segments) const {
+    Rotation rotations[OP_POP + 1];
+    buildRotations(rotations, settings.angle);
+
+    Segment segment = rootSegment();
+    Turtle turtle(segment.entry);
+    Lineage lineage(segment.lineage);
+    int branch = 0;
+
+    int depth = 0;
+    for (size_t i = 0; i < symbols.size(); i++) {
+        if (depth == 0 && i - segment.begin >= minLength) {
+            segment.end = i;
+            segments.push_back(segment);
+            segment.begin = i;
+            segment.entry = turtle;
+            segment.lineage = lineage;
+            segment.firstBranch = branch;
         }
-        else if (sym == "-")
-        {
-            turtle.applyUpRot(-mDfltAngle);
+
+        unsigned char op = mOps[(Symbol) symbols[i]];
+        if (op == OP_DRAW) branch++;
+        if (op == OP_PUSH) {
+            depth++;
+        } else if (op == OP_POP) {
+            if (--depth < 0) return false;
+        } else if (depth == 0) {
+            switch (op) {
+            case OP_DRAW:
+                turtle.moveForward(settings.step);
+                lineage.parent = branch - 1;
+                lineage.depth++;
+                break;
+            case OP_MOVE:
+                turtle.moveForward(settings.step);
+                lineage.parent = -1;
+                lineage.depth = 0;
+                break;
+            case OP_MODEL:
+                break;
+            default:
+                turtle.applyRotation(rotations[op]);
+                break;
+            }
         }
-        else if (sym == "&")
-        {
-            turtle.applyLeftRot(mDfltAngle);
+    }
+    segment.end = symbols.size();
+    segments.push_back(segment);
+    return true;
+}
+
+template <class Sink, class Branches, class Models>
+void LSystem::runTurtle(unsigned int n, Branches& branches, Models& models) {
+    Segment whole = rootSegment();
+    TurtleSettings settings;
+    settings.angle = mDfltAngle;
+    settings.step = mDfltStep;
+
+    // The output sizes are known from the production counts, so every
+    // output is allocated once
+    std::vector<unsigned long long> counts;
+    predictCounts(n, counts);
+    unsigned long long modelCount = 0;
+    for (unsigned int s = 0; s < 256; s++) {
+        if (mOps[s] == OP_MODEL) modelCount = addCounts(modelCount, counts[s]);
+    }
+    size_t reserveBranches = reserveSize(counts['F']);
+    size_t reserveFlowers = reserveSize(counts['*']);
+    size_t reserveModels = reserveSize(modelCount);
+
+    Bounds bounds;
+    if (mStreaming) {
+        Sink sink(branches, models);
+        sink.reserve(reserveBranches, reserveFlowers, reserveModels);
+        mTopology.reserve(reserveBranches);
+        DerivationCursor cursor(*this, n);
+        interpret(cursor, sink, settings, whole, bounds, mTopology);
+        setBounds(bounds);
+        return;
+    }
+
+    const std::string& symbols = getIteration(n);
+    unsigned int threads = workerThreads();
+
+    std::vector<Segment> segments;
+    if (threads > 1 && symbols.size() >= PARALLEL_MIN_SYMBOLS) {
+        size_t minLength = symbols.size() / (threads * SEGMENTS_PER_THREAD) + 1;
+        if (!splitSegments(symbols, settings, minLength, segments)) segments.clear();
+    }
+
+    if (segments.size() < 2) {
+        Sink sink(branches, models);
+        sink.reserve(reserveBranches, reserveFlowers, reserveModels);
+        mTopology.reserve(reserveBranches);
+        StringCursor cursor(symbols);
+        interpret(cursor, sink, settings, whole, bounds, mTopology);
+        setBounds(bounds);
+        return;
+    }
+
+    // Every segment fills its own containers, which are then appended in
+    // derivation order so the output matches a single threaded pass
+    int count = (int) segments.size();
+    std::vector<Branches> segmentBranches(count);
+    std::vector<Models> segmentModels(count);
+    std::vector<Bounds> segmentBounds(count);
+    std::vector<Topology> segmentTopology(count);
+#pragma omp parallel for schedule(dynamic) num_threads(threads)
+    for (int i = 0; i < count; i++) {
+        Sink sink(segmentBranches[i], segmentModels[i]);
+        StringCursor cursor(symbols, segments[i].begin, segments[i].end);
+        interpret(cursor, sink, settings, segments[i], segmentBounds[i], segmentTopology[i]);
+    }
+
+    size_t branchTotal = branches.size();
+    size_t modelTotal = models.size();
+    for (int i = 0; i < count; i++) {
+        branchTotal += segmentBranches[i].size();
+        modelTotal += segmentModels[i].size();
+    }
+    branches.reserve(branchTotal);
+    models.reserve(modelTotal);
+    for (int i = 0; i < count; i++) {
+        branches.insert(branches.end(), segmentBranches[i].begin(), segmentBranches[i].end());
+        models.insert(models.end(), segmentModels[i].begin(), segmentModels[i].end());
+    }
+
+    // Segments start at the top level, so their subtrees follow each other
+    bounds.all = emptyBox();
+    for (int i = 0; i < count; i++) {
+        mergeBox(bounds.all, segmentBounds[i].all);
+        bounds.subtrees.insert(bounds.subtrees.end(),
+            segmentBounds[i].subtrees.begin(), segmentBounds[i].subtrees.end());
+    }
+    setBounds(bounds);
+
+    // Segments number their branches from their first global index, so
+    // the topology only has to be appended
+    mTopology.clear();
+    mTopology.reserve(reserveBranches);
+    for (int i = 0; i < count; i++) {
+        mTopology.append(segmentTopology[i]);
+    }
+}
+
+/**
+ * Keeps the bounds of the last turtle pass in bboxes and the bounds buffer
+ **/
+void LSystem::setBounds(const Bounds& bounds) {
+    bboxes.clear();
+    bboxes.reserve(bounds.subtrees.size() + 1);
+    bboxes.push_back(bounds.all);
+    bboxes.insert(bboxes.end(), bounds.subtrees.begin(), bounds.subtrees.end());
+
+    mBoundsBuffer.resize(6 * bboxes.size());
+    for (unsigned int i = 0; i < bboxes.size(); i++) {
+        float* b = &mBoundsBuffer[6*i];
+        b[0] = (float) bboxes[i].first.n[0];
+        b[1] = (float) bboxes[i].first.n[1];
+        b[2] = (float) bboxes[i].first.n[2];
+        b[3] = (float) bboxes[i].second.n[0];
+        b[4] = (float) bboxes[i].second.n[1];
+        b[5] = (float) bboxes[i].second.n[2];
+    }
+}
+
+const std::vector<LSystem::Branch>& LSystem::getBounds() const {
+    return bboxes;
+}
+
+const std::vector<float>& LSystem::getBoundsBuffer() const {
+    return mBoundsBuffer;
+}
+
+void LSystem::Topology::clear() {
+    parents.clear();
+    depths.clear();
+    orders.clear();
+}
+
+void LSystem::Topology::reserve(size_t branches) {
+    parents.reserve(branches);
+    depths.reserve(branches);
+    orders.reserve(branches);
+}
+
+void LSystem::Topology::append(const Topology& other) {
+    parents.insert(parents.end(), other.parents.begin(), other.parents.end());
+    depths.insert(depths.end(), other.depths.begin(), other.depths.end());
+    orders.insert(orders.end(), other.orders.begin(), other.orders.end());
+}
+
+const std::vector<int>& LSystem::getBranchParents() const {
+    return mTopology.parents;
+}
+
+const std::vector<int>& LSystem::getBranchDepths() const {
+    return mTopology.depths;
+}
+
+const std::vector<int>& LSystem::getBranchOrders() const {
+    return mTopology.orders;
+}
+
+// LOOK: This is where the L-System creates the branches and the flowers.
+//        Branches are returns in the "branches" vector and flowers (or other symbols) are
+//        returned in the "models" vector.
+void LSystem::process(unsigned int n,
+    std::vector<Branch>& branches,
+    std::vector<Geometry>& models) {
+    runTurtle<GeometrySink>(n, branches, models);
+}
+
+/**
+ * Processes the LSystem into the contiguous branch and flower buffers
+ * branches: [startx, starty, startz, endx, endy, endz] per branch
+ * flowers:  [posx, posy, posz] per flower
+ **/
+void LSystem::processBuffers(unsigned int n) {
+    mBranchBuffer.clear();
+    mFlowerBuffer.clear();
+    runTurtle<BufferSink>(n, mBranchBuffer, mFlowerBuffer);
+}
+
+const std::vector<float>& LSystem::getBranchBuffer() const {
+    return mBranchBuffer;
+}
+
+const std::vector<float>& LSystem::getFlowerBuffer() const {
+    return mFlowerBuffer;
+}
+
+unsigned int LSystem::getBranchCount() const {
+    return mBranchBuffer.size() / 6;
+}
+
+unsigned int LSystem::getFlowerCount() const {
+    return mFlowerBuffer.size() / 3;
+}
+
+/**
+ * Runs every variant into its own buffers, grouped by iteration count so
+ * each derivation is built once and shared by the parallel turtle passes of
+ * its group, then appends the buffers in variant order
+ **/
+void LSystem::processBatch(const std::vector<float>& angles, const std::vector<float>& steps,
+    const std::vector<unsigned int>& iterations) {
+    int count = (int) MIN(angles.size(), MIN(steps.size(), iterations.size()));
+    std::vector<std::vector<float> > branches(count);
+    std::vector<std::vector<float> > flowers(count);
+
+    std::map<unsigned int, std::vector<int> > groups;
+    for (int i = 0; i < count; i++) {
+        groups[iterations[i]].push_back(i);
+    }
+
+    unsigned int threads = workerThreads();
+    std::map<unsigned int, std::vector<int> >::const_iterator group;
+    for (group = groups.begin(); group != groups.end(); ++group) {
+        unsigned int n = group->first;
+        const std::vector<int>& variants = group->second;
+
+        std::vector<unsigned long long> counts;
+        predictCounts(n, counts);
+        size_t reserveBranches = reserveSize(counts['F']);
+        size_t reserveFlowers = reserveSize(counts['*']);
+
+        // Streamed variants each expand the derivation on their own
+        const std::string* symbols = mStreaming? NULL : &getIteration(n);
+        int variantCount = (int) variants.size();
+#pragma omp parallel for schedule(dynamic) num_threads(threads)
+        for (int v = 0; v < variantCount; v++) {
+            int i = variants[v];
+            TurtleSettings settings;
+            settings.angle = angles[i];
+            settings.step = steps[i];
+
+            BufferSink sink(branches[i], flowers[i]);
+            sink.reserve(reserveBranches, reserveFlowers, 0);
+            Bounds bounds;
+            Topology topology;
+            if (symbols) {
+                StringCursor cursor(*symbols);
+                interpret(cursor, sink, settings, rootSegment(), bounds, topology);
+            } else {
+                DerivationCursor cursor(*this, n);
+                interpret(cursor, sink, settings, rootSegment(), bounds, topology);
+            }
+        }
+    }
+
+    size_t branchTotal = 0;
+    size_t flowerTotal = 0;
+    for (int i = 0; i < count; i++) {
+        branchTotal += branches[i].size();
+        flowerTotal += flowers[i].size();
+    }
+    mBatchBranchBuffer.clear();
+    mBatchFlowerBuffer.clear();
+    mBatchBranchBuffer.reserve(branchTotal);
+    mBatchFlowerBuffer.reserve(flowerTotal);
+    mBatchBranchOffsets.assign(1, 0);
+    mBatchFlowerOffsets.assign(1, 0);
+    for (int i = 0; i < count; i++) {
+        mBatchBranchBuffer.insert(mBatchBranchBuffer.end(), branches[i].begin(), branches[i].end());
+        mBatchFlowerBuffer.insert(mBatchFlowerBuffer.end(), flowers[i].begin(), flowers[i].end());
+        mBatchBranchOffsets.push_back(mBatchBranchBuffer.size() / 6);
+        mBatchFlowerOffsets.push_back(mBatchFlowerBuffer.size() / 3);
+    }
+}
+
+const std::vector<float>& LSystem::getBatchBranchBuffer() const {
+    return mBatchBranchBuffer;
+}
+
+const std::vector<float>& LSystem::getBatchFlowerBuffer() const {
+    return mBatchFlowerBuffer;
+}
+
+const std::vector<unsigned int>& LSystem::getBatchBranchOffsets() const {
+    return mBatchBranchOffsets;
+}
+
+const std::vector<unsigned int>& LSystem::getBatchFlowerOffsets() const {
+    return mBatchFlowerOffsets;
+}
+
+/**
+ * Finds the subtrees worth instancing. A (symbol, remaining depth) pair is
+ * instanced when it is rewritten, occurs more than once in the derivation
+ * and its brackets balance, so it leaves the turtle stack as it found it.
+ **/
+void LSystem::analyzeSubtrees(unsigned int n) {
+    unsigned int levels = n + 2;
+
+    // Net stack change and lowest stack level reached by every pair. Doubles
+    // because unbalanced subtrees can grow them exponentially.
+    std::vector<double> net(levels * 256, 0.0);
+    std::vector<double> low(levels * 256, 0.0);
+    for (unsigned int s = 0; s < 256; s++) {
+        if (mOps[s] == OP_PUSH) net[s] = 1.0;
+        if (mOps[s] == OP_POP) net[s] = low[s] = -1.0;
+    }
+    for (unsigned int d = 1; d < levels; d++) {
+        for (unsigned int s = 0; s < 256; s++) {
+            unsigned int key = d * 256 + s;
+            const Rule& rule = mRules[s];
+            if (!rule.defined) {
+                net[key] = net[s];
+                low[key] = low[s];
+                continue;
+            }
+            double total = 0.0;
+            double lowest = 0.0;
+            for (unsigned int i = 0; i < rule.length; i++) {
+                unsigned int child = (d - 1) * 256 + mRuleSymbols[rule.start + i];
+                lowest = MIN(lowest, total + low[child]);
+                total += net[child];
+            }
+            net[key] = total;
+            low[key] = lowest;
         }
-        else if (sym == "^")
-        {
-            turtle.applyLeftRot(-mDfltAngle);
+    }
+
+    // Occurrences of every pair, counted down from the axiom
+    std::vector<double> count(levels * 256, 0.0);
+    for (size_t i = 0; i < mAxiom.size(); i++) {
+        count[(n + 1) * 256 + mAxiom[i]] += 1.0;
+    }
+    for (unsigned int d = n + 1; d > 0; d--) {
+        for (unsigned int s = 0; s < 256; s++) {
+            unsigned int key = d * 256 + s;
+            const Rule& rule = mRules[s];
+            if (count[key] == 0.0 || !rule.defined) continue;
+            for (unsigned int i = 0; i < rule.length; i++) {
+                count[(d - 1) * 256 + mRuleSymbols[rule.start + i]] += count[key];
+            }
+        }
+    }
+
+    mInstanced.assign(levels * 256, false);
+    for (unsigned int d = 1; d < levels; d++) {
+        for (unsigned int s = 0; s < 256; s++) {
+            unsigned int key = d * 256 + s;
+            mInstanced[key] = mRules[s].defined && count[key] > 1.0
+                && net[key] == 0.0 && low[key] >= 0.0;
         }
-        else if (sym == "\\")
-        {
-            turtle.applyForwardRot(mDfltAngle);
+    }
+}
+
+/**
+ * Returns the template of a (symbol, remaining depth) pair, building it
+ * and the templates nested in it on first use
+ **/
+unsigned int LSystem::buildTemplate(Symbol sym, unsigned int depth) {
+    unsigned int key = depth * 256 + sym;
+    if (mTemplateIds[key] != (unsigned int) -1) return mTemplateIds[key];
+
+    // mTemplates was reserved for every instanced pair, so this reference
+    // stays valid while nested templates are appended
+    unsigned int id = mTemplates.size();
+    mTemplates.push_back(GeometryTemplate());
+    GeometryTemplate& geom = mTemplates.back();
+    geom.symbol = sym;
+    geom.depth = depth;
+
+    TemplateState state;
+    const Rule& rule = mRules[sym];
+    if (rule.length > 0) {
+        expandTemplate(geom, state, &mRuleSymbols[rule.start], rule.length, depth - 1);
+    }
+    geom.exit = state.turtle;
+
+    geom.branchCount = geom.branches.size() / 6;
+    geom.flowerCount = geom.flowers.size() / 3;
+    for (unsigned int i = 0; i < geom.instances.size(); i++) {
+        const GeometryTemplate& nested = mTemplates[geom.instances[i].id];
+        geom.branchCount += nested.branchCount;
+        geom.flowerCount += nested.flowerCount;
+    }
+
+    mTemplateIds[key] = id;
+    return id;
+}
+
+/**
+ * Runs the turtle over a run of symbols that each have depth rewrites
+ * left, adding geometry to the template and instancing repeated subtrees
+ **/
+void LSystem::expandTemplate(GeometryTemplate& geom, TemplateState& state,
+    const Symbol* symbols, unsigned int length, unsigned int depth) {
+    BufferSink sink(geom.branches, geom.flowers);
+    Turtle& turtle = state.turtle;
+    for (unsigned int i = 0; i < length; i++) {
+        Symbol sym = symbols[i];
+        const Rule& rule = mRules[sym];
+        if (depth > 0 && rule.defined) {
+            if (mInstanced[depth * 256 + sym]) {
+                Instance instance;
+                instance.id = buildTemplate(sym, depth);
+                instance.branchOffset = geom.branches.size() / 6;
+                instance.flowerOffset = geom.flowers.size() / 3;
+                instance.frame = turtle;
+                geom.instances.push_back(instance);
+
+                const vec3* axes[4] = { &turtle.pos, &turtle.forward, &turtle.left, &turtle.up };
+                geom.instanceIds.push_back(instance.id);
+                for (int a = 0; a < 4; a++) {
+                    geom.instanceFrames.push_back((float) axes[a]->n[0]);
+                    geom.instanceFrames.push_back((float) axes[a]->n[1]);
+                    geom.instanceFrames.push_back((float) axes[a]->n[2]);
+                }
+
+                // Carry on from where the subtree leaves the turtle
+                turtle = turtle.transform(mTemplates[instance.id].exit);
+            } else if (rule.length > 0) {
+                expandTemplate(geom, state, &mRuleSymbols[rule.start], rule.length, depth - 1);
+            }
+            continue;
         }
-        else if (sym == "/")
-        {
-            turtle.applyForwardRot(-mDfltAngle);
+
+        unsigned char op = mOps[sym];
+        switch (op) {
+        case OP_DRAW: {
+            vec3 start = turtle.pos;
+            turtle.moveForward(mDfltStep);
+            sink.addBranch(start, turtle.pos);
+            break;
         }
-        else if (sym == "|")
-        {
-            turtle.applyUpRot(180);
+        case OP_MOVE:
+            turtle.moveForward(mDfltStep);
+            break;
+        case OP_UP_POS:
+        case OP_UP_NEG:
+        case OP_LEFT_POS:
+        case OP_LEFT_NEG:
+        case OP_FORWARD_POS:
+        case OP_FORWARD_NEG:
+        case OP_TURN_AROUND:
+            turtle.applyRotation(mRotations[op]);
+            break;
+        case OP_PUSH:
+            state.stack.push_back(turtle);
+            break;
+        case OP_POP:
+            // Only the axiom can pop more than it pushed
+            if (state.stack.empty()) break;
+            turtle = state.stack.back();
+            state.stack.pop_back();
+            break;
+        default:
+            sink.addModel(turtle.pos, sym);
+            break;
         }
-        else if (sym == "[")
-        {
-            stack.push(turtle);
+    }
+}
+
+/**
+ * Processes the nth derivation into geometry templates without expanding
+ * it. Template 0 holds the axiom, its frame is the world frame.
+ **/
+void LSystem::processInstanced(unsigned int n) {
+    buildRotations(mRotations, mDfltAngle);
+    analyzeSubtrees(n);
+
+    size_t instanced = std::count(mInstanced.begin(), mInstanced.end(), true);
+    mTemplates.clear();
+    mTemplates.reserve(instanced + 1);
+    mTemplateIds.assign(mInstanced.size(), (unsigned int) -1);
+
+    mTemplates.push_back(GeometryTemplate());
+    GeometryTemplate& root = mTemplates.back();
+    root.symbol = 0;
+    root.depth = n + 1;
+
+    // Init so we're pointing up
+    TemplateState state;
+    state.turtle.applyUpRot(90);
+    if (!mAxiom.empty()) {
+        expandTemplate(root, state, &mAxiom[0], mAxiom.size(), n + 1);
+    }
+    root.exit = state.turtle;
+
+    root.branchCount = root.branches.size() / 6;
+    root.flowerCount = root.flowers.size() / 3;
+    for (unsigned int i = 0; i < root.instances.size(); i++) {
+        root.branchCount += mTemplates[root.instances[i].id].branchCount;
+        root.flowerCount += mTemplates[root.instances[i].id].flowerCount;
+    }
+}
+
+unsigned int LSystem::getTemplateCount() const {
+    return mTemplates.size();
+}
+
+std::string LSystem::getTemplateSymbol(unsigned int id) const {
+    const GeometryTemplate& geom = mTemplates.at(id);
+    // The root stands for the whole axiom rather than one symbol
+    return (id == 0)? std::string() : std::string(1, (char) geom.symbol);
+}
+
+unsigned int LSystem::getTemplateDepth(unsigned int id) const {
+    return mTemplates.at(id).depth;
+}
+
+const std::vector<float>& LSystem::getTemplateBranches(unsigned int id) const {
+    return mTemplates.at(id).branches;
+}
+
+const std::vector<float>& LSystem::getTemplateFlowers(unsigned int id) const {
+    return mTemplates.at(id).flowers;
+}
+
+const std::vector<unsigned int>& LSystem::getTemplateInstanceIds(unsigned int id) const {
+    return mTemplates.at(id).instanceIds;
+}
+
+const std::vector<float>& LSystem::getTemplateInstanceFrames(unsigned int id) const {
+    return mTemplates.at(id).instanceFrames;
+}
+
+/**
+ * Adds the geometry of a template placed at frame to the branch and flower
+ * buffers, emitting its own geometry and its instances in turtle order
+ **/
+void LSystem::flattenTemplate(unsigned int id, const Turtle& frame) {
+    const GeometryTemplate& geom = mTemplates[id];
+    BufferSink sink(mBranchBuffer, mFlowerBuffer);
+    unsigned int branch = 0;
+    unsigned int flower = 0;
+    for (unsigned int i = 0; i <= geom.instances.size(); i++) {
+        bool last = (i == geom.instances.size());
+        unsigned int branchEnd = last? geom.branches.size() / 6 : geom.instances[i].branchOffset;
+        unsigned int flowerEnd = last? geom.flowers.size() / 3 : geom.instances[i].flowerOffset;
+        for (; branch < branchEnd; branch++) {
+            const float* b = &geom.branches[branch * 6];
+            sink.addBranch(frame.transformPoint(vec3(b[0], b[1], b[2])),
+                frame.transformPoint(vec3(b[3], b[4], b[5])));
         }
-        else if (sym == "]")
-        {
-            turtle = stack.top();
-            stack.pop();
+        for (; flower < flowerEnd; flower++) {
+            const float* f = &geom.flowers[flower * 3];
+            sink.addModel(frame.transformPoint(vec3(f[0], f[1], f[2])), '*');
         }
-        else
-        {
-			// LOOK: When a different symbol (such as a *) is encountered, the turtle's position 
-			//        along with the corresponding symbol is added to the models vector.
-            models.push_back(Geometry(turtle.pos, sym));
+        if (!last) {
+            flattenTemplate(geom.instances[i].id, frame.transform(geom.instances[i].frame));
         }
     }
 }
+
+void LSystem::flattenInstances() {
+    mBranchBuffer.clear();
+    mFlowerBuffer.clear();
+    if (mTemplates.empty()) return;
+    mBranchBuffer.reserve(mTemplates[0].branchCount * 6);
+    mFlowerBuffer.reserve(mTemplates[0].flowerCount * 3);
+    flattenTemplate(0, Turtle());
+}
+
+/**
+ * 	Sets whether this LSystem has Resources to use
+ **/ 
+void LSystem::setHasResources(bool hasResources) {
+	mHasResources = hasResources;
+}
+
+
+/**
+ * Sets the optimal growth tuples
+ **/
+void LSystem::setOptimalBudDirs(
+	const std::vector<std::vector<float> >& buds, 
+	const std::vector<std::vector<float> >& dirs, 
+	const std::vector<float>& angles) {
+		// Size the flat arrays once
+		unsigned int count = buds.size();
+		mBudPositions.resize(3 * count);
+		mBudDirs.resize(3 * count);
+		mBudAngles.resize(count);
+
+		// Set the new Bud Position data
+		for (unsigned int i = 0; i < count; i++) {
+			// Copy the bud position
+			const std::vector<float>& b = buds.at(i);
+			mBudPositions[3*i] = b.at(0);
+			mBudPositions[3*i + 1] = b.at(1);
+			mBudPositions[3*i + 2] = b.at(2);
+
+			// Copy the direction
+			const std::vector<float>& d = dirs.at(i);
+			mBudDirs[3*i] = d.at(0);
+			mBudDirs[3*i + 1] = d.at(1);
+			mBudDirs[3*i + 2] = d.at(2);
+
+			// Copy the angle
+			mBudAngles[i] = angles.at(i);
+		}
+
+		buildBudIndex();
+}
+
+/**
+ * Sets the optimal growth tuples from flat arrays of count buds:
+ * buds and dirs hold 3 floats per bud, angles 1 float per bud
+ **/
+void LSystem::setOptimalBudData(const float* buds, const float* dirs, const float* angles, unsigned int count) {
+	mBudPositions.assign(buds, buds + 3 * count);
+	mBudDirs.assign(dirs, dirs + 3 * count);
+	mBudAngles.assign(angles, angles + count);
+	buildBudIndex();
+}
+
+const std::vector<float>& LSystem::getBudPositionBuffer() const {
+	return mBudPositions;
+}
+
+const std::vector<float>& LSystem::getBudDirBuffer() const {
+	return mBudDirs;
+}
+
+const std::vector<float>& LSystem::getBudAngleBuffer() const {
+	return mBudAngles;
+}
+
+unsigned int LSystem::getBudCount() const {
+	return mBudAngles.size();
+}
+
+void LSystem::setBudTolerance(float tolerance) {
+	mBudTolerance = tolerance;
+	buildBudIndex();
+}
+
+float LSystem::getBudTolerance() const {
+	return mBudTolerance;
+}
+
+/**
+ * Quantizes a coordinate to the index of its bud cell, clamped so that the
+ * index and its neighbours always fit
+ **/
+long long LSystem::budCell(float coord, float cell) const {
+	double c = floor(coord / cell);
+	// Also catches NaN
+	if (!(c > -MAX_BUD_CELL_INDEX)) return (long long) -MAX_BUD_CELL_INDEX;
+	if (c > MAX_BUD_CELL_INDEX) return (long long) MAX_BUD_CELL_INDEX;
+	return (long long) c;
+}
+
+unsigned int LSystem::budCellHash(long long x, long long y, long long z) const {
+	unsigned long long h = ((unsigned long long) x * 73856093ull) ^ ((unsigned long long) y * 19349663ull)
+		^ ((unsigned long long) z * 83492791ull);
+	return (unsigned int) (h ^ (h >> 32)) & (mBudCellHeads.size() - 1);
+}
+
+/**
+ * Rebuilds the spatial hash of the bud positions
+ **/
+void LSystem::buildBudIndex() {
+	// Power of two bucket count, about two buckets per bud
+	unsigned int buckets = 1;
+	while (buckets < 2 * getBudCount()) buckets <<= 1;
+	mBudCellHeads.assign(buckets, -1);
+	mBudCellNext.assign(getBudCount(), -1);
+
+	float cell = MAX(mBudTolerance, MIN_BUD_CELL);
+	// Chained in reverse so each bucket lists its buds in index order
+	for (int i = (int) getBudCount() - 1; i >= 0; i--) {
+		const float* p = &mBudPositions[3*i];
+		unsigned int h = budCellHash(budCell(p[0], cell), budCell(p[1], cell), budCell(p[2], cell));
+		mBudCellNext[i] = mBudCellHeads[h];
+		mBudCellHeads[h] = i;
+	}
+}
+
+/**
+ * Returns the index of the first bud within the tolerance of pos, or -1.
+ * A match lies in the cell of pos or in one of its neighbours.
+ **/
+int LSystem::findBud(const vec3& pos) const {
+	if (mBudPositions.empty()) return -1;
+
+	float cell = MAX(mBudTolerance, MIN_BUD_CELL);
+	double toleranceSq = (double) mBudTolerance * mBudTolerance;
+	long long cx = budCell(pos[0], cell);
+	long long cy = budCell(pos[1], cell);
+	long long cz = budCell(pos[2], cell);
+
+	int found = -1;
+	for (int dx = -1; dx <= 1; dx++) {
+		for (int dy = -1; dy <= 1; dy++) {
+			for (int dz = -1; dz <= 1; dz++) {
+				int i = mBudCellHeads[budCellHash(cx + dx, cy + dy, cz + dz)];
+				for (; i != -1; i = mBudCellNext[i]) {
+					// Other cells may share the bucket, and a lower index may wait in another bucket
+					if (found != -1 && i >= found) break;
+					const float* p = &mBudPositions[3*i];
+					double ex = p[0] - pos[0];
+					double ey = p[1] - pos[1];
+					double ez = p[2] - pos[2];
+					if (ex*ex + ey*ey + ez*ez <= toleranceSq) {
+						found = i;
+						break;
+					}
+				}
+			}
+		}
+	}
+	return found;
+}
+
+/**
+ * Gets the optimal growth tuples 
+ **/ 
+void LSystem::getOptimalBudDirs(
+	std::vector<std::vector<float> >& buds, std::vector<std::vector<float> >& dirs, std::vector<float>& angles) {
+		// Set the new data
+		for (unsigned int i = 0; i < getBudCount(); i++) {
+			// Push back the stored bud position
+			const float* b = &mBudPositions[3*i];
+			buds.push_back(std::vector<float>(b, b + 3));
+
+			// Push back the stored direction
+			const float* d = &mBudDirs[3*i];
+			dirs.push_back(std::vector<float>(d, d + 3));
+
+			// Push back the stored angle
+			angles.push_back(mBudAngles[i]);
+		}
+}
+
+/**
+ * Returns true if a given position is a bud
+ **/
+bool LSystem::isABud(vec3 pos) {
+	return findBud(pos) != -1;
+}
+
+
+/**
+ * Returns the budAxis and Angle for a given position if it is a bud
+ **/
+ bool LSystem::getBudAngle(vec3 pos, vec3& budAxis, float &budAngle) {
+
+	int i = findBud(pos);
+	if (i == -1) return false;
+
+	// Get bud dir/axis
+	const float* axis = &mBudDirs[3*i];
+	budAxis[0] = axis[0];
+	budAxis[1] = axis[1];
+	budAxis[2] = axis[2];
+
+	// Get angle
+	budAngle = mBudAngles[i];
+	return true;
+}
+
+/**
+ * Reseeds the random generator, then updates the bud geometry
+ **/
+void LSystem::updateBudGeometry(unsigned int n, std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers, unsigned int seed) {
+	setSeed(seed);
+	updateBudGeometry(n, branches, flowers);
+}
+
+/**
+ * Updates bud geometry so that is grows towards a light
+ **/
+void LSystem::updateBudGeometry(unsigned int n, std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers) {
+	updateBudBuffers(n);
+
+	// Add the new branches
+	for (unsigned int i = 0; i < mBudBranchBuffer.size(); i += 6) {
+		const float* b = &mBudBranchBuffer[i];
+		branches.push_back(std::vector<float>(b, b + 6));
+	}
+}
+
+void LSystem::updateBudBuffers(unsigned int n, unsigned int seed) {
+	setSeed(seed);
+	updateBudBuffers(n);
+}
+
+/**
+ * Grows every bud towards its light in one batched pass. For each growth
+ * step a bud moves forward or turns at random, then moves part of the way
+ * to its light. Buds are kept as arrays of their state, each with its own
+ * random stream, and write into their own slots of the output buffer.
+ **/
+void LSystem::updateBudBuffers(unsigned int n) {
+	const unsigned int MAX_ITERATIONS = 4;
+	int count = (int) getBudCount();
+
+	// One stream per bud, all derived from a single draw so that reseeding
+	// replays the whole pass
+	unsigned int base = mRandom.next();
+	std::vector<Random> random(count);
+	std::vector<unsigned int> steps(count);
+	std::vector<size_t> offsets(count + 1, 0);
+	unsigned int maxSteps = 0;
+	for (int i = 0; i < count; i++) {
+		random[i].seed(base, i);
+		steps[i] = random[i].nextInt(MAX_ITERATIONS) + n;
+		maxSteps = MAX(maxSteps, steps[i]);
+		// At most two branches per step
+		offsets[i + 1] = offsets[i] + 2 * 6 * steps[i];
+	}
+
+	// Bud state as arrays, each bud starting from the default turtle frame
+	std::vector<vec3> pos(count);
+	std::vector<vec3> lights(count);
+	std::vector<vec3> forward(count, FORWARD_AXIS);
+	std::vector<vec3> left(count, LEFT_AXIS);
+	std::vector<vec3> up(count, UP_AXIS);
+	std::vector<size_t> written(count, 0);
+	for (int i = 0; i < count; i++) {
+		const float* bp = &mBudPositions[3*i];
+		const float* lp = &mBudDirs[3*i];
+		pos[i] = vec3(bp[0], bp[1], bp[2]);
+		lights[i] = vec3(lp[0], lp[1], lp[2]);
+	}
+
+	mBudBranchBuffer.resize(offsets[count]);
+	float* output = mBudBranchBuffer.empty()? NULL : &mBudBranchBuffer[0];
+
+	unsigned int threads = workerThreads();
+
+	for (unsigned int step = 0; step < maxSteps; step++) {
+#pragma omp parallel for num_threads(threads) if(count >= PARALLEL_MIN_BUDS)
+		for (int i = 0; i < count; i++) {
+			if (step >= steps[i]) continue;
+
+			Random& r = random[i];
+			unsigned int movement = r.nextInt(5);
+			int jitter = (r.nextInt(2) == 0) ? 1 : -1;
+			int angle = jitter * (int) (r.nextInt(35) + 50);
+
+			float* b = output + offsets[i] + written[i];
+			vec3 start = pos[i];
+			switch (movement) {
+				case 0:
+					// Move forward and add a new branch
+					pos[i] = start + (mDfltStep + jitter * 0.2f) * forward[i];
+					b[0] = start[0]; b[1] = start[1]; b[2] = start[2];
+					b[3] = pos[i][0]; b[4] = pos[i][1]; b[5] = pos[i][2];
+					b += 6;
+					written[i] += 6;
+					start = pos[i];
+					break;
+				case 1:
+					rotateFrame(Rotation(2, angle).m, forward[i], left[i], up[i]);
+					break;
+				case 2:
+					rotateFrame(Rotation(1, angle).m, forward[i], left[i], up[i]);
+					break;
+				default:
+					break;
+			}
+
+			// Grow 10-34% of the way towards the light and add a new branch
+			// (we don't want all the buds to growth fully to the light)
+			float growthRate = (r.nextInt(25) + 10) / 100.0f;
+			pos[i] = start + growthRate * (lights[i] - start);
+			b[0] = start[0]; b[1] = start[1]; b[2] = start[2];
+			b[3] = pos[i][0]; b[4] = pos[i][1]; b[5] = pos[i][2];
+			written[i] += 6;
+		}
+	}
+
+	// Close the gaps left by buds that drew fewer than two branches a step
+	size_t end = 0;
+	for (int i = 0; i < count; i++) {
+		std::copy(output + offsets[i], output + offsets[i] + written[i], output + end);
+		end += written[i];
+	}
+	mBudBranchBuffer.resize(end);
+}
+
+const std::vector<float>& LSystem::getBudBranchBuffer() const {
+	return mBudBranchBuffer;
+}
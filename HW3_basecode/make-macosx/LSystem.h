@@ -4,19 +4,27 @@
 #include <string>
 #include <vector>
 #include <map>
+#include <stack>
 #include "vec.h"
+#include "Quaternion.h"
 
+// All state lives in the instance, so different LSystems can be used from
+// different threads at once. A single LSystem is not safe to share.
 class LSystem
 {
 public:
     typedef std::pair<vec3, std::string> Geometry;
     typedef std::pair<vec3, vec3> Branch;
 
+    // Grammar symbols are identified by their byte value
+    typedef unsigned char Symbol;
+
 public:
     LSystem();
     ~LSystem() {}
 
-    // Set/get inputs
+    // Set/get inputs. Loading the grammar that is already loaded from a
+    // string keeps its cached derivations.
     void loadProgram(const std::string& fileName);
     void loadProgramFromString(const std::string& program);
     void setDefaultAngle(float degrees);
@@ -26,33 +34,347 @@ public:
     float getDefaultStep() const;
     const std::string& getGrammarString() const;
 
-    // Iterate grammar
+    // When streaming, the turtle reads the nth derivation straight from a
+    // depth first expansion of the axiom instead of from getIteration(n)
+    void setStreaming(bool streaming);
+    bool getStreaming() const;
+
+    // Threads the turtle uses on large materialized derivations: 0 uses
+    // every core, 1 keeps it on the calling thread. Needs OpenMP.
+    void setThreads(unsigned int threads);
+    unsigned int getThreads() const;
+
+    // Seed of the instance's random generator. Reseeding restarts the
+    // sequence, so the same inputs and seed give the same geometry.
+    void setSeed(unsigned int seed);
+    unsigned int getSeed() const;
+
+    // Iterate grammar. The returned derivation stays valid until the next
+    // call, which may evict it from the iteration cache.
     const std::string& getIteration(unsigned int n);
 
+    // Iteration cache: the newest derivation is always kept, older ones are
+    // kept as checkpoints while they fit in the byte budget
+    void setIterationCacheBudget(size_t bytes);
+    size_t getIterationCacheBudget() const;
+    size_t getIterationCacheBytes() const;
+    unsigned int getIterationCacheHits() const;
+    unsigned int getIterationCacheMisses() const;
+    void resetIterationCacheStats();
+
+    // Sizes of the nth derivation predicted from the production counts,
+    // without deriving it: its length and how many of a symbol, branches
+    // ('F'), brackets ('[') and flowers ('*') it holds. Counts too large to
+    // represent saturate at the largest unsigned long long.
+    unsigned long long predictLength(unsigned int n) const;
+    unsigned long long predictSymbolCount(unsigned int n, Symbol symbol) const;
+    unsigned long long predictBranchCount(unsigned int n) const;
+    unsigned long long predictBracketCount(unsigned int n) const;
+    unsigned long long predictFlowerCount(unsigned int n) const;
+
+    // Random access into the nth derivation without materializing it. The
+    // derivation is read from the grammar's (symbol, rewrites left)
+    // expansions, shared by every iteration, and their lengths, so it costs
+    // 256 lengths per iteration however long it is. getDerivationSymbol
+    // returns 0 past the end; predictLength gives the length. Indices are
+    // exact while the length has not saturated.
+    Symbol getDerivationSymbol(unsigned int n, unsigned long long index);
+    std::string getDerivationSlice(unsigned int n, unsigned long long begin, unsigned int count);
+
     // Get geometry from running the turtle
-    void process(unsigned int n, 
+    void process(unsigned int n,
         std::vector<Branch>& branches);
-    void process(unsigned int n, 
-        std::vector<Branch>& branches, 
+    void process(unsigned int n,
+        std::vector<Branch>& branches,
         std::vector<Geometry>& models);
 
 	// Process the L-System and return the branches and the flowers.
 	void processPy(unsigned int n,
-		std::vector<std::vector<float> >& branches, 
+		std::vector<std::vector<float> >& branches,
         std::vector<std::vector<float> >& flowers);
+	void processPy(unsigned int n,
+		std::vector<std::vector<float> >& branches,
+        std::vector<std::vector<float> >& flowers,
+        std::vector<std::vector<float> >& bounds);
+	void processPy(unsigned int n,
+		std::vector<std::vector<float> >& branches,
+        std::vector<std::vector<float> >& flowers, unsigned int seed);
+
+	// Process the L-System into contiguous buffers owned by the LSystem:
+	// 6 floats (start, end) per branch and 3 floats per flower. The buffers
+	// are replaced by the next call.
+	void processBuffers(unsigned int n);
+	const std::vector<float>& getBranchBuffer() const;
+	const std::vector<float>& getFlowerBuffer() const;
+	unsigned int getBranchCount() const;
+	unsigned int getFlowerCount() const;
+
+	// Bounds found by the last turtle pass, as (min, max) corners: the whole
+	// tree first, then each subtree opened at the top level, in derivation
+	// order. A box with min > max holds no geometry.
+	const std::vector<Branch>& getBounds() const;
+	const std::vector<float>& getBoundsBuffer() const; // 6 floats per box
+
+	// Topology found by the last turtle pass, one entry per branch: the
+	// index of the branch it grows from (-1 if none), its depth in branches
+	// from the root, and its branch order (0 on the main axis, one more
+	// inside every bracket).
+	const std::vector<int>& getBranchParents() const;
+	const std::vector<int>& getBranchDepths() const;
+	const std::vector<int>& getBranchOrders() const;
+
+	// Subtree instancing: processes the nth derivation into geometry
+	// templates, one per (symbol, remaining depth) subtree that repeats and
+	// has balanced brackets. A template holds its own branches and flowers
+	// in the local frame of the turtle entering the subtree, plus one
+	// instance record (template id and a 12 float frame: position, forward,
+	// left, up) per subtree nested in it. Template 0 is the whole tree in
+	// world space.
+	void processInstanced(unsigned int n);
+	unsigned int getTemplateCount() const;
+	std::string getTemplateSymbol(unsigned int id) const;
+	unsigned int getTemplateDepth(unsigned int id) const;
+	const std::vector<float>& getTemplateBranches(unsigned int id) const;
+	const std::vector<float>& getTemplateFlowers(unsigned int id) const;
+	const std::vector<unsigned int>& getTemplateInstanceIds(unsigned int id) const;
+	const std::vector<float>& getTemplateInstanceFrames(unsigned int id) const;
+
+	// Expands the templates from processInstanced() into the branch and
+	// flower buffers, in the order processBuffers() fills them
+	void flattenInstances();
+
+		// LSystem Fxns
+
+	void setHasResources(bool hasResources);
+
+	void setOptimalBudDirs(const std::vector<std::vector<float> >& buds, const std::vector<std::vector<float> >& dirs, const std::vector<float>& angles);
+    void getOptimalBudDirs(std::vector<std::vector<float> >& buds, std::vector<std::vector<float> >& dirs, std::vector<float>& angles);
+
+	// Flat bud transfer: 3 floats of position and 3 of direction per bud,
+	// and 1 angle, copied in a single pass each way
+	void setOptimalBudData(const float* buds, const float* dirs, const float* angles, unsigned int count);
+	const std::vector<float>& getBudPositionBuffer() const;
+	const std::vector<float>& getBudDirBuffer() const;
+	const std::vector<float>& getBudAngleBuffer() const;
+	unsigned int getBudCount() const;
+	
+	bool getBudAngle(vec3 pos, vec3& budAxis, float &budAngle);
+	bool isABud(vec3 pos);
+
+	// Buds are matched within this distance, so positions that drifted on
+	// their way through Python still find their bud
+	void setBudTolerance(float tolerance);
+	float getBudTolerance() const;
+
+	void updateBudGeometry(unsigned int n, std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers);
+	void updateBudGeometry(unsigned int n, std::vector<std::vector<float> >& branches, std::vector<std::vector<float> >& flowers, unsigned int seed);
+
+	// Grows all buds in one batched pass into the bud branch buffer, 6
+	// floats (start, end) per new branch. The buffer is replaced by the
+	// next call.
+	void updateBudBuffers(unsigned int n);
+	void updateBudBuffers(unsigned int n, unsigned int seed);
+	const std::vector<float>& getBudBranchBuffer() const;
+
+	// Runs the turtle for many variants of the loaded grammar in one call,
+	// variant i with angles[i], steps[i] and iterations[i]. Variants with
+	// the same iteration count share one derivation and the variants run in
+	// parallel. All branches go to one buffer, 6 floats per branch, variant
+	// i's from branch getBatchBranchOffsets()[i] to [i + 1]; flowers go to
+	// another, 3 floats per flower. The buffers are replaced by the next
+	// call. Only as many variants as the shortest list are run.
+	void processBatch(const std::vector<float>& angles, const std::vector<float>& steps,
+		const std::vector<unsigned int>& iterations);
+	const std::vector<float>& getBatchBranchBuffer() const;
+	const std::vector<float>& getBatchFlowerBuffer() const;
+	const std::vector<unsigned int>& getBatchBranchOffsets() const;
+	const std::vector<unsigned int>& getBatchFlowerOffsets() const;
+	
+
+
+	// LSYSTEM Variables
+	float mDfltAngle;
+    float mDfltStep;
+    std::string mGrammar;
+    // True when mGrammar holds the loaded grammar (loadProgramFromString)
+    bool mGrammarFromString;
+	bool mHasResources;
+	bool mStreaming;
+	unsigned int mThreads;
+
+	// Buds stored flat: 3 floats per position and direction, 1 per angle
+	std::vector<float> mBudPositions;
+	std::vector<float> mBudAngles;
+	std::vector<float> mBudDirs;
+
 
 protected:
     void reset();
     void addProduction(std::string line);
-    std::string iterate(const std::string& input);
-    
+    void compile();
+    std::string iterate(const std::string& input, size_t size);
+    size_t rewrittenLength(const std::string& input, size_t begin, size_t end) const;
+    char* rewrite(const std::string& input, size_t begin, size_t end, char* out) const;
+    unsigned int workerThreads() const;
+
+    // Number of every symbol in the nth derivation, found by applying the
+    // production count matrix n + 1 times to the axiom's counts. lengths,
+    // when given, receives the length of every derivation up to the nth.
+    void predictCounts(unsigned int n, std::vector<unsigned long long>& counts,
+        std::vector<unsigned long long>* lengths = NULL) const;
+
+    // Length of every symbol after d rewrites, at [d * 256 + symbol], for d
+    // up to the deepest built so far. Cleared when the grammar changes.
+    std::vector<unsigned long long> mExpansionLengths;
+    void buildExpansionLengths(unsigned int depth);
+    void evictIterations(unsigned int pinned);
+
+    // A cached derivation and the cache clock value of its last use
+    struct CachedIteration {
+        std::string symbols;
+        unsigned long lastUse;
+    };
+
     std::map<std::string, std::string> productions;
-    std::vector<std::string> iterations;
+    std::map<unsigned int, CachedIteration> iterations;
+    size_t mCacheBudget;
+    size_t mCacheBytes;
+    unsigned long mCacheClock;
+    unsigned int mCacheHits;
+    unsigned int mCacheMisses;
     std::vector<Branch> bboxes;
     std::string current;
-    float mDfltAngle;
-    float mDfltStep;
-    std::string mGrammar;
+
+    // xoshiro128** generator, local to the instance so results depend only
+    // on its seed and not on other users of rand()
+    class Random
+    {
+    public:
+        Random(unsigned int seed = 0);
+        void seed(unsigned int seed);
+        void seed(unsigned int seed, unsigned int stream);
+        unsigned int next();
+        unsigned int nextInt(unsigned int bound); // in [0, bound)
+
+    private:
+        unsigned int mState[4];
+    };
+
+    unsigned int mSeed;
+    Random mRandom;
+
+    // Turtle command bound to a symbol
+    enum TurtleOp {
+        OP_MODEL,           // not a command, emitted as geometry
+        OP_DRAW,            // F
+        OP_MOVE,            // f
+        OP_UP_POS,          // +
+        OP_UP_NEG,          // -
+        OP_LEFT_POS,        // &
+        OP_LEFT_NEG,        // ^
+        OP_FORWARD_POS,     // '\'
+        OP_FORWARD_NEG,     // /
+        OP_TURN_AROUND,     // |
+        OP_PUSH,            // [
+        OP_POP              // ]
+    };
+
+    // Compiled grammar: every production is a run of symbols in one buffer,
+    // addressed through per-symbol tables
+    struct Rule {
+        unsigned int start;
+        unsigned int length;
+        bool defined;
+    };
+    std::vector<Symbol> mAxiom;
+    std::vector<Symbol> mRuleSymbols;
+    Rule mRules[256];
+    unsigned char mOps[256];
+
+    // Reads a materialized derivation symbol by symbol
+    class StringCursor
+    {
+    public:
+        StringCursor(const std::string& symbols);
+        StringCursor(const std::string& symbols, size_t begin, size_t end);
+        bool next(Symbol& sym);
+
+    private:
+        const std::string& mSymbols;
+        size_t mPos;
+        size_t mEnd;
+    };
+
+    // Produces the nth derivation symbol by symbol by expanding the axiom
+    // depth first. Memory is bounded by the derivation depth. seek needs
+    // the expansion lengths built up to n + 1 rewrites.
+    class DerivationCursor
+    {
+    public:
+        DerivationCursor(const LSystem& lsys, unsigned int n);
+        bool next(Symbol& sym);
+        void seek(unsigned long long index);
+
+    private:
+        struct Frame {
+            const Symbol* symbols;
+            unsigned int length;
+            unsigned int pos;
+            unsigned int depth; // rewrites left for the symbols of this run
+        };
+        const LSystem& mLSystem;
+        std::vector<Frame> mStack;
+        unsigned int mDepth;
+    };
+
+    // Collects turtle geometry as Branch/Geometry pairs
+    class GeometrySink
+    {
+    public:
+        GeometrySink(std::vector<Branch>& branches, std::vector<Geometry>& models);
+        void reserve(size_t branches, size_t flowers, size_t models);
+        void addBranch(const vec3& start, const vec3& end);
+        void addModel(const vec3& pos, Symbol sym);
+
+    private:
+        std::vector<Branch>& mBranches;
+        std::vector<Geometry>& mModels;
+    };
+
+    // Collects turtle geometry as flat float buffers, keeping only flowers
+    class BufferSink
+    {
+    public:
+        BufferSink(std::vector<float>& branches, std::vector<float>& flowers);
+        void reserve(size_t branches, size_t flowers, size_t models);
+        void addBranch(const vec3& start, const vec3& end);
+        void addModel(const vec3& pos, Symbol sym);
+
+    private:
+        std::vector<float>& mBranches;
+        std::vector<float>& mFlowers;
+    };
+
+    std::vector<float> mBranchBuffer;
+    std::vector<float> mFlowerBuffer;
+    std::vector<float> mBudBranchBuffer;
+    std::vector<float> mBatchBranchBuffer;
+    std::vector<float> mBatchFlowerBuffer;
+    std::vector<unsigned int> mBatchBranchOffsets;
+    std::vector<unsigned int> mBatchFlowerOffsets;
+    std::vector<float> mBoundsBuffer;
+
+    // Rotation of the turtle frame about one of its local axes, stored as
+    // the 3x3 block of math::RotationMatrix so it can be built once and
+    // applied many times
+    class Rotation
+    {
+    public:
+        Rotation();
+        Rotation(int axis, float degrees);
+
+        double m[3][3];
+    };
 
     class Turtle
     {
@@ -65,12 +387,141 @@ protected:
         void applyUpRot(float degrees);
         void applyLeftRot(float degrees);
         void applyForwardRot(float degrees);
+        void applyRotation(const Rotation& rot);
+
+        // Maps points, directions and frames expressed in the local frame
+        // of a turtle that started at Turtle() into this turtle's frame
+        vec3 transformPoint(const vec3& p) const;
+        vec3 transformDir(const vec3& d) const;
+        Turtle transform(const Turtle& local) const;
 
+		void rotateByAxisAngle(const vec3 axis, float angle);
         vec3 pos;
         vec3 up;
         vec3 forward;
         vec3 left;
     };
+
+    // A subtree nested in a template: the template it instances, the frame
+    // it starts from and how many of the parent's own branches and flowers
+    // come before it
+    struct Instance {
+        unsigned int id;
+        unsigned int branchOffset;
+        unsigned int flowerOffset;
+        Turtle frame;
+    };
+
+    struct GeometryTemplate {
+        Symbol symbol;
+        unsigned int depth;
+        std::vector<float> branches;
+        std::vector<float> flowers;
+        std::vector<Instance> instances;
+        std::vector<unsigned int> instanceIds;
+        std::vector<float> instanceFrames;
+        Turtle exit;            // turtle frame once the subtree is done
+        size_t branchCount;     // branches once flattened
+        size_t flowerCount;     // flowers once flattened
+    };
+
+    // Turtle state while a template is built
+    struct TemplateState {
+        Turtle turtle;
+        std::vector<Turtle> stack;
+    };
+
+    void buildRotations(Rotation* rotations, float angle) const;
+    void analyzeSubtrees(unsigned int n);
+    unsigned int buildTemplate(Symbol sym, unsigned int depth);
+    void expandTemplate(GeometryTemplate& geom, TemplateState& state,
+        const Symbol* symbols, unsigned int length, unsigned int depth);
+    void flattenTemplate(unsigned int id, const Turtle& frame);
+
+    std::vector<GeometryTemplate> mTemplates;
+    std::vector<bool> mInstanced;               // by depth * 256 + symbol
+    std::vector<unsigned int> mTemplateIds;     // by depth * 256 + symbol
+    Rotation mRotations[OP_POP + 1];
+
+    // The branch the next branch on an axis grows from (-1 if none), the
+    // depth that branch gets, and the order of the axis
+    struct Lineage {
+        int parent;
+        int depth;
+        int order;
+    };
+
+    // A run of a derivation that starts at the top level of the bracket
+    // structure, with the turtle and lineage it starts from and the index
+    // of its first branch
+    struct Segment {
+        size_t begin;
+        size_t end;
+        Turtle entry;
+        Lineage lineage;
+        int firstBranch;
+    };
+
+    // The whole derivation, from the turtle pointing up
+    Segment rootSegment() const;
+
+    // Angle and step of a turtle pass
+    struct TurtleSettings {
+        float angle;
+        float step;
+    };
+
+    bool splitSegments(const std::string& symbols, const TurtleSettings& settings,
+        size_t minLength, std::vector<Segment>& segments) const;
+
+    // Bounding boxes gathered while interpreting: all the geometry, and the
+    // geometry of each subtree opened at the top level
+    struct Bounds {
+        Branch all;
+        std::vector<Branch> subtrees;
+    };
+
+    void setBounds(const Bounds& bounds);
+
+    // Branch topology gathered while interpreting, indexed by branch
+    struct Topology {
+        std::vector<int> parents;
+        std::vector<int> depths;
+        std::vector<int> orders;
+
+        void clear();
+        void reserve(size_t branches);
+        void append(const Topology& other);
+    };
+    Topology mTopology;
+
+    // Runs the turtle over the nth derivation, streamed or materialized, and
+    // in parallel over top level segments when the derivation is large.
+    // Sink is built from the two output containers.
+    template <class Sink, class Branches, class Models>
+    void runTurtle(unsigned int n, Branches& branches, Models& models);
+
+    // Runs the turtle from the start of segment over every symbol produced
+    // by the cursor. Only reads the LSystem, so passes can run in parallel.
+    template <class Cursor, class Sink>
+    void interpret(Cursor& cursor, Sink& sink, const TurtleSettings& settings,
+        const Segment& segment, Bounds& bounds, Topology& topology) const;
+
+    // Spatial hash over mBudPositions. Buds are bucketed by their position
+    // quantized to cells of the bud tolerance, and each bucket is a chain
+    // of bud indices.
+    void buildBudIndex();
+    int findBud(const vec3& pos) const;
+    long long budCell(float coord, float cell) const;
+    unsigned int budCellHash(long long x, long long y, long long z) const;
+
+    float mBudTolerance;
+    std::vector<int> mBudCellHeads;     // first bud of each bucket, -1 if empty
+    std::vector<int> mBudCellNext;      // next bud in the same bucket
+
+	//std::map<std::string, int> mBud;
+	std::stack<Turtle> mBudPosStack;
+
 };
 
-#endif
\ No newline at end of file
+#endif
@@ -143,6 +143,100 @@ class VecFloat(_object):
 VecFloat_swigregister = _LSystem.VecFloat_swigregister
 VecFloat_swigregister(VecFloat)
 
+class VecUInt(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, VecUInt, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, VecUInt, name)
+    __repr__ = _swig_repr
+    def iterator(self): return _LSystem.VecUInt_iterator(self)
+    def __iter__(self): return self.iterator()
+    def __nonzero__(self): return _LSystem.VecUInt___nonzero__(self)
+    def __bool__(self): return _LSystem.VecUInt___bool__(self)
+    def __len__(self): return _LSystem.VecUInt___len__(self)
+    def pop(self): return _LSystem.VecUInt_pop(self)
+    def __getslice__(self, *args): return _LSystem.VecUInt___getslice__(self, *args)
+    def __setslice__(self, *args): return _LSystem.VecUInt___setslice__(self, *args)
+    def __delslice__(self, *args): return _LSystem.VecUInt___delslice__(self, *args)
+    def __delitem__(self, *args): return _LSystem.VecUInt___delitem__(self, *args)
+    def __getitem__(self, *args): return _LSystem.VecUInt___getitem__(self, *args)
+    def __setitem__(self, *args): return _LSystem.VecUInt___setitem__(self, *args)
+    def append(self, *args): return _LSystem.VecUInt_append(self, *args)
+    def empty(self): return _LSystem.VecUInt_empty(self)
+    def size(self): return _LSystem.VecUInt_size(self)
+    def clear(self): return _LSystem.VecUInt_clear(self)
+    def swap(self, *args): return _LSystem.VecUInt_swap(self, *args)
+    def get_allocator(self): return _LSystem.VecUInt_get_allocator(self)
+    def begin(self): return _LSystem.VecUInt_begin(self)
+    def end(self): return _LSystem.VecUInt_end(self)
+    def rbegin(self): return _LSystem.VecUInt_rbegin(self)
+    def rend(self): return _LSystem.VecUInt_rend(self)
+    def pop_back(self): return _LSystem.VecUInt_pop_back(self)
+    def erase(self, *args): return _LSystem.VecUInt_erase(self, *args)
+    def __init__(self, *args): 
+        this = _LSystem.new_VecUInt(*args)
+        try: self.this.append(this)
+        except: self.this = this
+    def push_back(self, *args): return _LSystem.VecUInt_push_back(self, *args)
+    def front(self): return _LSystem.VecUInt_front(self)
+    def back(self): return _LSystem.VecUInt_back(self)
+    def assign(self, *args): return _LSystem.VecUInt_assign(self, *args)
+    def resize(self, *args): return _LSystem.VecUInt_resize(self, *args)
+    def insert(self, *args): return _LSystem.VecUInt_insert(self, *args)
+    def reserve(self, *args): return _LSystem.VecUInt_reserve(self, *args)
+    def capacity(self): return _LSystem.VecUInt_capacity(self)
+    __swig_destroy__ = _LSystem.delete_VecUInt
+    __del__ = lambda self : None;
+VecUInt_swigregister = _LSystem.VecUInt_swigregister
+VecUInt_swigregister(VecUInt)
+
+class VecInt(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, VecInt, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, VecInt, name)
+    __repr__ = _swig_repr
+    def iterator(self): return _LSystem.VecInt_iterator(self)
+    def __iter__(self): return self.iterator()
+    def __nonzero__(self): return _LSystem.VecInt___nonzero__(self)
+    def __bool__(self): return _LSystem.VecInt___bool__(self)
+    def __len__(self): return _LSystem.VecInt___len__(self)
+    def pop(self): return _LSystem.VecInt_pop(self)
+    def __getslice__(self, *args): return _LSystem.VecInt___getslice__(self, *args)
+    def __setslice__(self, *args): return _LSystem.VecInt___setslice__(self, *args)
+    def __delslice__(self, *args): return _LSystem.VecInt___delslice__(self, *args)
+    def __delitem__(self, *args): return _LSystem.VecInt___delitem__(self, *args)
+    def __getitem__(self, *args): return _LSystem.VecInt___getitem__(self, *args)
+    def __setitem__(self, *args): return _LSystem.VecInt___setitem__(self, *args)
+    def append(self, *args): return _LSystem.VecInt_append(self, *args)
+    def empty(self): return _LSystem.VecInt_empty(self)
+    def size(self): return _LSystem.VecInt_size(self)
+    def clear(self): return _LSystem.VecInt_clear(self)
+    def swap(self, *args): return _LSystem.VecInt_swap(self, *args)
+    def get_allocator(self): return _LSystem.VecInt_get_allocator(self)
+    def begin(self): return _LSystem.VecInt_begin(self)
+    def end(self): return _LSystem.VecInt_end(self)
+    def rbegin(self): return _LSystem.VecInt_rbegin(self)
+    def rend(self): return _LSystem.VecInt_rend(self)
+    def pop_back(self): return _LSystem.VecInt_pop_back(self)
+    def erase(self, *args): return _LSystem.VecInt_erase(self, *args)
+    def __init__(self, *args): 
+        this = _LSystem.new_VecInt(*args)
+        try: self.this.append(this)
+        except: self.this = this
+    def push_back(self, *args): return _LSystem.VecInt_push_back(self, *args)
+    def front(self): return _LSystem.VecInt_front(self)
+    def back(self): return _LSystem.VecInt_back(self)
+    def assign(self, *args): return _LSystem.VecInt_assign(self, *args)
+    def resize(self, *args): return _LSystem.VecInt_resize(self, *args)
+    def insert(self, *args): return _LSystem.VecInt_insert(self, *args)
+    def reserve(self, *args): return _LSystem.VecInt_reserve(self, *args)
+    def capacity(self): return _LSystem.VecInt_capacity(self)
+    __swig_destroy__ = _LSystem.delete_VecInt
+    __del__ = lambda self : None;
+VecInt_swigregister = _LSystem.VecInt_swigregister
+VecInt_swigregister(VecInt)
+
 class VectorPyBranch(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, VectorPyBranch, name, value)
@@ -209,9 +303,112 @@ class LSystem(_object):
     def getDefaultAngle(self): return _LSystem.LSystem_getDefaultAngle(self)
     def getDefaultStep(self): return _LSystem.LSystem_getDefaultStep(self)
     def getGrammarString(self): return _LSystem.LSystem_getGrammarString(self)
+    def setStreaming(self, *args): return _LSystem.LSystem_setStreaming(self, *args)
+    def getStreaming(self): return _LSystem.LSystem_getStreaming(self)
+    def setThreads(self, *args): return _LSystem.LSystem_setThreads(self, *args)
+    def getThreads(self): return _LSystem.LSystem_getThreads(self)
+    def setSeed(self, *args): return _LSystem.LSystem_setSeed(self, *args)
+    def getSeed(self): return _LSystem.LSystem_getSeed(self)
     def getIteration(self, *args): return _LSystem.LSystem_getIteration(self, *args)
+    def setIterationCacheBudget(self, *args): return _LSystem.LSystem_setIterationCacheBudget(self, *args)
+    def getIterationCacheBudget(self): return _LSystem.LSystem_getIterationCacheBudget(self)
+    def getIterationCacheBytes(self): return _LSystem.LSystem_getIterationCacheBytes(self)
+    def getIterationCacheHits(self): return _LSystem.LSystem_getIterationCacheHits(self)
+    def getIterationCacheMisses(self): return _LSystem.LSystem_getIterationCacheMisses(self)
+    def resetIterationCacheStats(self): return _LSystem.LSystem_resetIterationCacheStats(self)
+    def predictLength(self, *args): return _LSystem.LSystem_predictLength(self, *args)
+    def predictSymbolCount(self, *args): return _LSystem.LSystem_predictSymbolCount(self, *args)
+    def predictBranchCount(self, *args): return _LSystem.LSystem_predictBranchCount(self, *args)
+    def predictBracketCount(self, *args): return _LSystem.LSystem_predictBracketCount(self, *args)
+    def predictFlowerCount(self, *args): return _LSystem.LSystem_predictFlowerCount(self, *args)
+    def getDerivationSymbol(self, *args): return _LSystem.LSystem_getDerivationSymbol(self, *args)
+    def getDerivationSlice(self, *args): return _LSystem.LSystem_getDerivationSlice(self, *args)
     def process(self, *args): return _LSystem.LSystem_process(self, *args)
     def processPy(self, *args): return _LSystem.LSystem_processPy(self, *args)
+    def processBuffers(self, *args): return _LSystem.LSystem_processBuffers(self, *args)
+    def getBranchBuffer(self): return _LSystem.LSystem_getBranchBuffer(self)
+    def getFlowerBuffer(self): return _LSystem.LSystem_getFlowerBuffer(self)
+    def getBranchCount(self): return _LSystem.LSystem_getBranchCount(self)
+    def getFlowerCount(self): return _LSystem.LSystem_getFlowerCount(self)
+    def getBounds(self): return _LSystem.LSystem_getBounds(self)
+    def getBoundsBuffer(self): return _LSystem.LSystem_getBoundsBuffer(self)
+    def getBranchParents(self): return _LSystem.LSystem_getBranchParents(self)
+    def getBranchDepths(self): return _LSystem.LSystem_getBranchDepths(self)
+    def getBranchOrders(self): return _LSystem.LSystem_getBranchOrders(self)
+    def processInstanced(self, *args): return _LSystem.LSystem_processInstanced(self, *args)
+    def getTemplateCount(self): return _LSystem.LSystem_getTemplateCount(self)
+    def getTemplateSymbol(self, *args): return _LSystem.LSystem_getTemplateSymbol(self, *args)
+    def getTemplateDepth(self, *args): return _LSystem.LSystem_getTemplateDepth(self, *args)
+    def getTemplateBranches(self, *args): return _LSystem.LSystem_getTemplateBranches(self, *args)
+    def getTemplateFlowers(self, *args): return _LSystem.LSystem_getTemplateFlowers(self, *args)
+    def getTemplateInstanceIds(self, *args): return _LSystem.LSystem_getTemplateInstanceIds(self, *args)
+    def getTemplateInstanceFrames(self, *args): return _LSystem.LSystem_getTemplateInstanceFrames(self, *args)
+    def flattenInstances(self): return _LSystem.LSystem_flattenInstances(self)
+    def setHasResources(self, *args): return _LSystem.LSystem_setHasResources(self, *args)
+    def setOptimalBudDirs(self, *args): return _LSystem.LSystem_setOptimalBudDirs(self, *args)
+    def getOptimalBudDirs(self, *args): return _LSystem.LSystem_getOptimalBudDirs(self, *args)
+    def getBudPositionBuffer(self): return _LSystem.LSystem_getBudPositionBuffer(self)
+    def getBudDirBuffer(self): return _LSystem.LSystem_getBudDirBuffer(self)
+    def getBudAngleBuffer(self): return _LSystem.LSystem_getBudAngleBuffer(self)
+    def getBudCount(self): return _LSystem.LSystem_getBudCount(self)
+    def getBudAngle(self, *args): return _LSystem.LSystem_getBudAngle(self, *args)
+    def isABud(self, *args): return _LSystem.LSystem_isABud(self, *args)
+    def setBudTolerance(self, *args): return _LSystem.LSystem_setBudTolerance(self, *args)
+    def getBudTolerance(self): return _LSystem.LSystem_getBudTolerance(self)
+    def updateBudGeometry(self, *args): return _LSystem.LSystem_updateBudGeometry(self, *args)
+    def updateBudBuffers(self, *args): return _LSystem.LSystem_updateBudBuffers(self, *args)
+    def getBudBranchBuffer(self): return _LSystem.LSystem_getBudBranchBuffer(self)
+    def processBatch(self, *args): return _LSystem.LSystem_processBatch(self, *args)
+    def getBatchBranchBuffer(self): return _LSystem.LSystem_getBatchBranchBuffer(self)
+    def getBatchFlowerBuffer(self): return _LSystem.LSystem_getBatchFlowerBuffer(self)
+    def getBatchBranchOffsets(self): return _LSystem.LSystem_getBatchBranchOffsets(self)
+    def getBatchFlowerOffsets(self): return _LSystem.LSystem_getBatchFlowerOffsets(self)
+    __swig_setmethods__["mDfltAngle"] = _LSystem.LSystem_mDfltAngle_set
+    __swig_getmethods__["mDfltAngle"] = _LSystem.LSystem_mDfltAngle_get
+    if _newclass:mDfltAngle = _swig_property(_LSystem.LSystem_mDfltAngle_get, _LSystem.LSystem_mDfltAngle_set)
+    __swig_setmethods__["mDfltStep"] = _LSystem.LSystem_mDfltStep_set
+    __swig_getmethods__["mDfltStep"] = _LSystem.LSystem_mDfltStep_get
+    if _newclass:mDfltStep = _swig_property(_LSystem.LSystem_mDfltStep_get, _LSystem.LSystem_mDfltStep_set)
+    __swig_setmethods__["mGrammar"] = _LSystem.LSystem_mGrammar_set
+    __swig_getmethods__["mGrammar"] = _LSystem.LSystem_mGrammar_get
+    if _newclass:mGrammar = _swig_property(_LSystem.LSystem_mGrammar_get, _LSystem.LSystem_mGrammar_set)
+    __swig_setmethods__["mGrammarFromString"] = _LSystem.LSystem_mGrammarFromString_set
+    __swig_getmethods__["mGrammarFromString"] = _LSystem.LSystem_mGrammarFromString_get
+    if _newclass:mGrammarFromString = _swig_property(_LSystem.LSystem_mGrammarFromString_get, _LSystem.LSystem_mGrammarFromString_set)
+    __swig_setmethods__["mHasResources"] = _LSystem.LSystem_mHasResources_set
+    __swig_getmethods__["mHasResources"] = _LSystem.LSystem_mHasResources_get
+    if _newclass:mHasResources = _swig_property(_LSystem.LSystem_mHasResources_get, _LSystem.LSystem_mHasResources_set)
+    __swig_setmethods__["mStreaming"] = _LSystem.LSystem_mStreaming_set
+    __swig_getmethods__["mStreaming"] = _LSystem.LSystem_mStreaming_get
+    if _newclass:mStreaming = _swig_property(_LSystem.LSystem_mStreaming_get, _LSystem.LSystem_mStreaming_set)
+    __swig_setmethods__["mThreads"] = _LSystem.LSystem_mThreads_set
+    __swig_getmethods__["mThreads"] = _LSystem.LSystem_mThreads_get
+    if _newclass:mThreads = _swig_property(_LSystem.LSystem_mThreads_get, _LSystem.LSystem_mThreads_set)
+    __swig_setmethods__["mBudPositions"] = _LSystem.LSystem_mBudPositions_set
+    __swig_getmethods__["mBudPositions"] = _LSystem.LSystem_mBudPositions_get
+    if _newclass:mBudPositions = _swig_property(_LSystem.LSystem_mBudPositions_get, _LSystem.LSystem_mBudPositions_set)
+    __swig_setmethods__["mBudAngles"] = _LSystem.LSystem_mBudAngles_set
+    __swig_getmethods__["mBudAngles"] = _LSystem.LSystem_mBudAngles_get
+    if _newclass:mBudAngles = _swig_property(_LSystem.LSystem_mBudAngles_get, _LSystem.LSystem_mBudAngles_set)
+    __swig_setmethods__["mBudDirs"] = _LSystem.LSystem_mBudDirs_set
+    __swig_getmethods__["mBudDirs"] = _LSystem.LSystem_mBudDirs_get
+    if _newclass:mBudDirs = _swig_property(_LSystem.LSystem_mBudDirs_get, _LSystem.LSystem_mBudDirs_set)
+    def getBranchBufferView(self): return _LSystem.LSystem_getBranchBufferView(self)
+    def getFlowerBufferView(self): return _LSystem.LSystem_getFlowerBufferView(self)
+    def getBoundsBufferView(self): return _LSystem.LSystem_getBoundsBufferView(self)
+    def getBranchParentsView(self): return _LSystem.LSystem_getBranchParentsView(self)
+    def getBranchDepthsView(self): return _LSystem.LSystem_getBranchDepthsView(self)
+    def getBranchOrdersView(self): return _LSystem.LSystem_getBranchOrdersView(self)
+    def getTemplateBranchesView(self, *args): return _LSystem.LSystem_getTemplateBranchesView(self, *args)
+    def getTemplateFlowersView(self, *args): return _LSystem.LSystem_getTemplateFlowersView(self, *args)
+    def getTemplateInstanceFramesView(self, *args): return _LSystem.LSystem_getTemplateInstanceFramesView(self, *args)
+    def setOptimalBudBuffers(self, *args): return _LSystem.LSystem_setOptimalBudBuffers(self, *args)
+    def getBatchBranchBufferView(self): return _LSystem.LSystem_getBatchBranchBufferView(self)
+    def getBatchFlowerBufferView(self): return _LSystem.LSystem_getBatchFlowerBufferView(self)
+    def getBudBranchBufferView(self): return _LSystem.LSystem_getBudBranchBufferView(self)
+    def getBudPositionView(self): return _LSystem.LSystem_getBudPositionView(self)
+    def getBudDirView(self): return _LSystem.LSystem_getBudDirView(self)
+    def getBudAngleView(self): return _LSystem.LSystem_getBudAngleView(self)
 LSystem_swigregister = _LSystem.LSystem_swigregister
 LSystem_swigregister(LSystem)
 
@@ -101,6 +101,7 @@
 #  include <cmath>
 #  include <cstdio>
 #  include <cstdlib>
+#  include <cstring>
 #  include <string>
 #  include <iostream>
 #endif
@@ -9,6 +9,13 @@ import maya.OpenMayaAnim as OpenMayaAnim
 import maya.OpenMayaMPx as OpenMayaMPx
 import maya.OpenMayaRender as OpenMayaRender
 
+# NumPy is optional (not every Maya install ships it). Array fast paths are
+# skipped when it is missing.
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
 #------------------------------------------------------------------------------#
 # Global Functions & Variables for Maya-Stem
 #------------------------------------------------------------------------------#
@@ -19,6 +26,16 @@ STEM_VERSION = '0.2'
 STEM_GITHUB_SITE = 'https://github.com/mriveralee/maya-stem/'
 STEM_HELP_SITE = 'http://github.com/mriveralee/maya-stem/issues'
 
+# Memory budget of an LSystem base tree, predicted from its grammar before
+# deriving it. Nodes warn past the first size and refuse past the second.
+LSYSTEM_WARN_BYTES = 256 * 1024 * 1024
+LSYSTEM_MAX_BYTES = 1024 * 1024 * 1024
+
+# Rough cost of a branch (geometry, internode and its cylinder mesh) and a
+# flower in the base tree, on top of one byte per derived symbol
+LSYSTEM_BYTES_PER_BRANCH = 1024
+LSYSTEM_BYTES_PER_FLOWER = 64
+
 # Maya's OpenGL Renderer & Function table api
 GL_RENDERER = OpenMayaRender.MHardwareRenderer.theRenderer()
 GLFT = GL_RENDERER.glFunctionTable()
@@ -26,6 +43,31 @@ GLFT = GL_RENDERER.glFunctionTable()
 # DEG2RAD
 DEG_2_RAD = 180 / math.pi
 
+'''
+'' Returns true if NumPy is available for the array fast paths
+'''
+def hasNumpy():
+  return np is not None
+
+'''
+'' Wraps a float buffer from the LSystem (e.g. getBranchBufferView()) as an
+'' (N x width) float32 array without copying. The array views LSystem memory
+'' and is only valid until that buffer is refilled.
+'''
+def wrapFloatBuffer(buf, width):
+  if len(buf) == 0:
+    return np.zeros((0, width), dtype=np.float32)
+  return np.frombuffer(buf, dtype=np.float32).reshape(-1, width)
+
+'''
+'' Wraps an int buffer from the LSystem (e.g. getBranchParentsView()) as an
+'' int32 array without copying, valid until that buffer is refilled.
+'''
+def wrapIntBuffer(buf):
+  if len(buf) == 0:
+    return np.zeros(0, dtype=np.int32)
+  return np.frombuffer(buf, dtype=np.int32)
+
 
 '''
 '' Functions for declaring attributes as inputs
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import StemTreeStore as STS
+
+#------------------------------------------------------------------------------#
+# Append-only log of a tree's growth iterations
+#------------------------------------------------------------------------------#
+
+'''
+'' Keeps every internode ever grown in one StemTreeStore, in the order they
+'' were grown. A growth iteration appends shoots and changes the state of the
+'' internodes (buds, Q and V), never their links, so the tree after any
+'' iteration is a prefix of the store with the state it had then. The log
+'' keeps the state entries each iteration changed, with their old and new
+'' values, and rebuilds the state of an iteration only for a view of it.
+'''
+class StemGrowthLog:
+
+  '''
+  '' Starts the log from the store of the base tree (iteration 0)
+  '''
+  def __init__(self, store):
+    self.mStore = store
+    # Size of the store after each iteration
+    self.mSizes = []
+    # State entries changed by each iteration, see StemTreeState.getChanges.
+    # Iteration 0 changes them from the zeroed state.
+    self.mChanges = []
+    # State after the last iteration, which the next changes are taken from
+    self.mLastState = STS.StemTreeState()
+    self.endIteration()
+
+  '''
+  '' Records the tree after the iteration that grew the store last
+  '''
+  def endIteration(self):
+    state = self.mStore.mState
+    self.mSizes.append(len(self.mStore))
+    self.mChanges.append(state.getChanges(self.mLastState))
+    self.mLastState = state.copy()
+
+  '''
+  '' Gets the number of growth iterations in the log
+  '''
+  def getIterationCount(self):
+    return len(self.mSizes) - 1
+
+  '''
+  '' Gets the store of the newest tree, which growth extends in place
+  '''
+  def getStore(self):
+    return self.mStore
+
+  '''
+  '' Gets a view of the tree after an iteration, with its own copy of the
+  '' state then
+  '''
+  def getView(self, iteration):
+    size = self.mSizes[iteration]
+    newest = len(self.mSizes) - 1
+    # Replay the changes from the zeroed state or undo them from the newest
+    # state, whichever goes through fewer iterations
+    if iteration < newest - iteration:
+      state = STS.StemTreeState(size)
+      for i in xrange(iteration + 1):
+        state.applyChanges(self.mChanges[i])
+    else:
+      state = self.mLastState.copy(size)
+      for i in xrange(newest, iteration, -1):
+        state.applyChanges(self.mChanges[i], True)
+    return StemTreeView(self.mStore, size, state)
+
+
+'''
+'' The first mSize internodes of a StemTreeStore with the state they had after
+'' one growth iteration. Links to internodes grown later are hidden.
+'''
+class StemTreeView:
+
+  def __init__(self, store, size, state):
+    self.mStore = store
+    self.mSize = size
+    self.mState = state
+
+  def __len__(self):
+    return self.mSize
+
+  '''
+  '' Gets the start point of an internode as a tuple
+  '''
+  def getStart(self, node):
+    return self.mStore.getStart(node)
+
+  '''
+  '' Gets the end point of an internode as a tuple
+  '''
+  def getEnd(self, node):
+    return self.mStore.getEnd(node)
+
+  '''
+  '' Gets the parent of an internode, -1 at a root. Parents come before their
+  '' children, so they are always in the view.
+  '''
+  def getParent(self, node):
+    return self.mStore.getParent(node)
+
+  '''
+  '' Gets the children of an internode in this view
+  '''
+  def getChildren(self, node):
+    return self.mStore.getChildren(node, self.mSize)
+
+  '''
+  '' Gets the internodes without children in this view
+  '''
+  def getLeaves(self):
+    return self.mStore.getLeaves(self.mSize)
@@ -2,7 +2,6 @@
 import sys, math, ctypes, copy
 import random
 import LSystem
-from collections import deque
 
 import maya
 import maya.cmds as cmds
@@ -16,6 +15,9 @@ import StemGlobal as SG
 import StemLightNode as SL
 import StemCylinder as SC
 import StemBud as SB
+import StemGrowthLog as SGL
+import StemTreeStore as STS
+import StemTreeTopology as STT
 
 
 #------------------------------------------------------------------------------#
@@ -126,10 +128,11 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
 
 
   # LSystem Variables
-  mLSystem = LSystem.LSystem()
+  mLSystem = None
   mPrevGrammarFile = None
   mPrevGrammarContent = None
   mPrevAngle = None
+  mPrevStep = None
   mPrevIterations = None
 
   # Optimal Point Curves Drawn
@@ -147,19 +150,59 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
   # Reference to the the maya dependency node
   mStemNode = None
 
-  # The Dictionary story the geometry for each iterations 0 is Lsystem Base
-  mTreeGrowthInternodes = {}
+  # Log of the tree's growth, iteration 0 is the LSystem Base
+  mGrowthLog = None
+
+  # BFS levels and node lists of the growing tree, updated as shoots are
+  # appended
+  mTreeTopology = None
 
   # The base branches and flowers for the LSystem
   mBaseBranches = None
   mBaseFlowers = None
 
+  # Bounds of the LSystem base tree: 6 floats (min, max) for the whole tree,
+  # then 6 per subtree opened at the trunk
+  mBaseBounds = None
+
+  # Index of the parent branch of every base branch, -1 for none
+  mBaseParents = None
+
 
   '''
   '' StemInstance Node Constructor
   '''
   def __init__(self):
     OpenMayaMPx.MPxLocatorNode.__init__(self)
+    # Each node owns its LSystem so nodes can be computed on different threads
+    self.mLSystem = LSystem.LSystem()
+
+  '''
+  '' Returns true if the loaded LSystem bindings have a method. The compiled
+  '' module shipped with the plugin can be older than LSystem.i, so calls
+  '' added since then fall back to the older API when they are missing.
+  '''
+  def hasLSystemMethod(self, name):
+    return hasattr(self.mLSystem, name)
+
+  '''
+  '' Bounded by the base tree once it exists, so the viewport can cull it
+  '''
+  def isBounded(self):
+    return True
+
+  '''
+  '' Bounding box of the display circle and the LSystem base tree
+  '''
+  def boundingBox(self):
+    r = self.mDisplayRadius
+    box = OpenMaya.MBoundingBox(OpenMaya.MPoint(-r, 0, -r), OpenMaya.MPoint(r, 0, r))
+    b = self.mBaseBounds
+    # An inverted box holds no geometry
+    if b is not None and len(b) >= 6 and b[0] <= b[3]:
+      box.expand(OpenMaya.MPoint(b[0], b[1], b[2]))
+      box.expand(OpenMaya.MPoint(b[3], b[4], b[5]))
+    return box
 
   '''
   '' Draw/Onscreen render method for displaying this node
@@ -199,77 +242,80 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       print"================================================================="
       print"================================================================="
       print "length of internodes list: " + str(len(self.mInternodes))
-    if ENABLE_RESOURCE_DRAWING:
+    if ENABLE_RESOURCE_DRAWING and len(self.mInternodes) > 0:
+      # The tree shown and its state after that growth iteration
+      tree = self.mInternodes
+      state = tree.mState
+
       # Draw resource distribution values at "bud" (ahem) locations
       glFT.glPushAttrib(OpenMayaRender.MGL_CURRENT_BIT)
       glFT.glColor4f(0.0, 1.0, 0.0, 0.0)
       # For each internode, if it has a terminal but draw it. If it has a
       # lateral bud draw it. Also draw the resources are their usual spots (ends).
-      for b in self.mInternodes:
-        # if b.hasTerminalBud() and b.hasLateralBud():
-        val = int(b.mVResourceAmount * 100) / 100.0
+      for b in xrange(len(tree)):
+        end = tree.getEnd(b)
+        val = int(state.mV[b] * 100) / 100.0
         if ENABLE_RESOURCE_V_DRAWING:
-          view.drawText(str(val), b.mEnd, OpenMayaUI.M3dView.kCenter)
+          view.drawText(str(val), OpenMaya.MPoint(end[0], end[1], end[2]), OpenMayaUI.M3dView.kCenter)
         if ENABLE_RESOURCE_V_PRINTING:
           print "~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*"
-          print "internode end at " + str(b.mEnd[0]) + " , " + str(b.mEnd[1]) + " , " + str(b.mEnd[2])
+          print "internode end at " + str(end[0]) + " , " + str(end[1]) + " , " + str(end[2])
 
-        if b.hasTerminalBud():
-          tBud = b.getTerminalBud()
-          tBudPos = b.mEnd
-          tBudPosAdjusted = OpenMaya.MPoint(tBudPos[0]+0.05, tBudPos[1], tBudPos[2])
-          tResourceVal = int(tBud.mVResourceAmount * 100) / 100.0
+        if state.hasBud(b, STS.BUD_TERMINAL):
+          tBudV = state.getBudV(b, STS.BUD_COLUMN_TERMINAL)
+          tBudPosAdjusted = OpenMaya.MPoint(end[0]+0.05, end[1], end[2])
+          tResourceVal = int(tBudV * 100) / 100.0
           if ENABLE_RESOURCE_V_DRAWING:
             view.drawText(str(tResourceVal), tBudPosAdjusted, OpenMayaUI.M3dView.kCenter)
           if ENABLE_RESOURCE_V_PRINTING:
             print "terminal:"
-            print tBud.mVResourceAmount
-        if b.hasLateralBud():
-          lBud = b.getLateralBud()
-          lBudPos = b.mEnd
-          lBudPosAdjusted = OpenMaya.MPoint(lBudPos[0]-0.05, lBudPos[1], lBudPos[2])
-          lResourceVal = int(lBud.mVResourceAmount * 100) / 100.0
+            print tBudV
+        if state.hasBud(b, STS.BUD_LATERAL):
+          lBudV = state.getBudV(b, STS.BUD_COLUMN_LATERAL)
+          lBudPosAdjusted = OpenMaya.MPoint(end[0]-0.05, end[1], end[2])
+          lResourceVal = int(lBudV * 100) / 100.0
           if ENABLE_RESOURCE_V_DRAWING:
             view.drawText(str(lResourceVal), lBudPosAdjusted, OpenMayaUI.M3dView.kCenter)
           if ENABLE_RESOURCE_V_PRINTING:
             print "lateral:"
-            print lBud.mVResourceAmount
+            print lBudV
 
       glFT.glPopAttrib()
 
       # Draw light distribution values at base locations
       glFT.glPushAttrib(OpenMayaRender.MGL_CURRENT_BIT)
       glFT.glColor4f(1.0, 0.84, 0.0, 0.0)
-      for b in self.mInternodes:
-        val = int(b.mQLightAmount * 100) / 100.0
-        point = b.mStart + ((b.mEnd - b.mStart) / 2.0)
+      for b in xrange(len(tree)):
+        start = tree.getStart(b)
+        end = tree.getEnd(b)
+        val = int(state.mQ[b] * 100) / 100.0
+        point = OpenMaya.MPoint(start[0] + (end[0] - start[0]) / 2.0,
+          start[1] + (end[1] - start[1]) / 2.0, start[2] + (end[2] - start[2]) / 2.0)
         if ENABLE_RESOURCE_Q_DRAWING:
           view.drawText(str(val), point, OpenMayaUI.M3dView.kCenter)
         if ENABLE_RESOURCE_Q_PRINTING:
           print "@~@~@~@@~@~@~@@~@~@~@~@~@~@~@@~@~@~@~@"
-          print "internode end at " + str(b.mEnd[0]) + " , " + str(b.mEnd[1]) + " , " + str(b.mEnd[2])
-          print b.mQLightAmount
-
-        if b.hasTerminalBud():
-          tBud = b.getTerminalBud()
-          tBudPos = b.mEnd
-          tBudPosAdjusted = OpenMaya.MPoint(tBudPos[0]+0.05, tBudPos[1], tBudPos[2])
-          tLightVal = int(tBud.mQLightAmount * 100) / 100.0
+          print "internode end at " + str(end[0]) + " , " + str(end[1]) + " , " + str(end[2])
+          print state.mQ[b]
+
+        if state.hasBud(b, STS.BUD_TERMINAL):
+          tBudQ = state.getBudQ(b, STS.BUD_COLUMN_TERMINAL)
+          tBudPosAdjusted = OpenMaya.MPoint(end[0]+0.05, end[1], end[2])
+          tLightVal = int(tBudQ * 100) / 100.0
           if ENABLE_RESOURCE_Q_DRAWING:
             view.drawText(str(tLightVal), tBudPosAdjusted, OpenMayaUI.M3dView.kCenter)
           if ENABLE_RESOURCE_Q_PRINTING:
             print "terminal:"
-            print tBud.mQLightAmount
-        if b.hasLateralBud():
-          lBud = b.getLateralBud()
-          lBudPos = b.mEnd
-          lBudPosAdjusted = OpenMaya.MPoint(lBudPos[0]-0.05, lBudPos[1], lBudPos[2])
-          lLightVal = int(lBud.mQLightAmount * 100) / 100.0
+            print tBudQ
+        if state.hasBud(b, STS.BUD_LATERAL):
+          lBudQ = state.getBudQ(b, STS.BUD_COLUMN_LATERAL)
+          lBudPosAdjusted = OpenMaya.MPoint(end[0]-0.05, end[1], end[2])
+          lLightVal = int(lBudQ * 100) / 100.0
           if ENABLE_RESOURCE_Q_DRAWING:
             view.drawText(str(lLightVal), lBudPosAdjusted, OpenMayaUI.M3dView.kCenter)
           if ENABLE_RESOURCE_Q_PRINTING:
             print "lateral:"
-            print lBud.mQLightAmount
+            print lBudQ
 
       glFT.glPopAttrib()
     view.endGL()
@@ -321,22 +367,25 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
 
         print 'Scene Resource Nodes are dirty!'
 
-      # Init LSystem only when grammar/angle/iters change
+      # Init LSystem only when grammar/angle/step/iters change. The LSystem
+      # keeps its derivations while the grammar is unchanged, so angle and
+      # step changes only rerun the turtle.
       shouldInitLSystem = shouldClearSceneResources
       shouldInitLSystem = shouldInitLSystem or grammarFile != self.mPrevGrammarFile
       shouldInitLSystem = shouldInitLSystem or angle != self.mPrevAngle
+      shouldInitLSystem = shouldInitLSystem or step != self.mPrevStep
       shouldInitLSystem = shouldInitLSystem or iters != self.mPrevIterations
 
       # Make LSystem Base Tree for growing
       if shouldInitLSystem:
         # grab base branches & flowers
-        self.initLSystemBaseTree(iters, angle, step, grammarFile)
+        if self.initLSystemBaseTree(iters, angle, step, grammarFile) is None:
+          data.setClean(plug)
+          return
 
-        # Create Internodes for them
-        internodes = self.createInternodes(self.mBaseBranches, self.mBaseFlowers)
-
-        # Store in the first keyframe
-        self.mTreeGrowthInternodes['1'] = internodes
+        # Store the tree of them and start the growth log from it
+        store = STS.createTreeStore(self.mBaseBranches, self.mBaseParents)
+        self.mGrowthLog = SGL.StemGrowthLog(store)
 
 
       # TODO Growth the branches and flowers for this growth iteration
@@ -351,10 +400,29 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       print 'StemInstance Generated!'
 
   '''
-  '' Clears the mTreeGrowthInternodes Cache
+  '' Clears the growth log
   '''
   def clearTreeGrowthInternodes(self):
-    self.mTreeGrowthInternodes.clear()
+    self.mGrowthLog = None
+    self.mTreeTopology = None
+
+  '''
+  '' Clears the tree, its bounds and its curves and mesh when no base tree can
+  '' be made, so the node shows nothing rather than the last tree. The next
+  '' compute makes the base tree again.
+  '''
+  def clearTreeOutput(self):
+    self.clearTreeGrowthInternodes()
+    self.mInternodes = []
+    self.mBaseBranches = None
+    self.mBaseFlowers = None
+    self.mBaseParents = None
+    self.mBaseBounds = None
+    self.mPrevIterations = None
+
+    self.eraseCurves(self.mTreeCurves)
+    self.deleteTreeExtrusionMesh()
+    self.mTreeMesh = None
 
   '''
   '' Clears the SCENE_RESOURCE_NODES
@@ -407,102 +475,84 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
   '' Creates a Cylinder Mesh based on the LSystem
   '''
   def growTree(self, growthIters, baseGrowthAngle, growthAngleJitter, hasResources, data):
-    growthKey = str(growthIters)
+    growthLog = self.mGrowthLog
     if growthIters <= 1 or not hasResources:
       ''' Case: No resource growth is used or is initial LSystem Tree '''
-      growthKey = '1'
-    elif self.mTreeGrowthInternodes.get(growthKey) is None:
-      ''' Case: No Internodes for a growthIteration -- compute the growth '''
-      startGrowthNum = 1
-      endGrowthNum = growthIters + 1
-
-      # Create Pre Bud Growth Internodes
-      preBudGrowthInternodes = self.mTreeGrowthInternodes.get('1')
-
-      # Save computation by copying a previously used internode list :)
-      for i in range(1, endGrowthNum):
-        gKey = str(i)
-        growth = self.mTreeGrowthInternodes.get(gKey)
-        if growth is not None:
-          startGrowthNum = i
-          preBudGrowthInternodes = self.copyInternodes(growth)
-
-      if preBudGrowthInternodes is None:
-        preBudGrowthInternodes = self.mTreeGrowthInternodes.get('1')
-
-
-      preBudGrowthInternodes = self.copyInternodes(preBudGrowthInternodes)
-      ''' Now compute the growth for the internode list '''
-      for i in range(startGrowthNum, endGrowthNum):
+      growthIters = 0
+    elif growthLog.getIterationCount() < growthIters:
+      ''' Case: The log ends before growthIteration -- grow its newest tree '''
+      # The newest tree is grown in place
+      store = growthLog.getStore()
+      state = store.mState
+      for i in range(growthLog.getIterationCount(), growthIters):
         # Update the optimals pre growth internodes
-        self.updateOptimalGrowthPairs(preBudGrowthInternodes)
+        self.updateOptimalGrowthPairs(store)
 
         #  Assign Q values, growth dirs etc will get assigned
-        # Set the current internodes
-        self.configureBudInternodeHeirarchy(preBudGrowthInternodes)
+        self.configureBudInternodeHeirarchy(store)
 
-        # Set the current internodes
-        # self.mInternodes = preBudGrowthInternodes
         # Now perform resource distribution
-        self.performBHModelResourceDistribution(preBudGrowthInternodes)
+        self.performBHModelResourceDistribution(store)
 
         if ENABLE_BUD_DRAWING:
-          self.drawBuds(preBudGrowthInternodes)
+          self.drawBuds(store)
 
         # Grow all branches of the tree using v-value (buds toward the light)
         lengthMultipler = 0.25
-        radius = 0.25
         minGrowthAngle = math.floor(baseGrowthAngle - growthAngleJitter)
         maxGrowthAngle = math.floor(baseGrowthAngle + growthAngleJitter)
 
-        # Shoots for appendings
-        newShoots = []
+        # Light point of every bud with a growth pair, by bud position
+        # growthPair = (budPosition, optPt, lightQValue)
+        lightPoints = {}
+        for gPair in self.mOptimalGrowthPairs:
+          lightPoints[tuple(gPair[0])] = gPair[1]
 
-        for b in preBudGrowthInternodes:
+        # Shoots are appended to the store as they grow, each one the child
+        # of the internode before it. The buds are found first, so this
+        # iteration's shoots don't grow again.
+        for b in self.getGrowingBudInternodes(store):
           nextStart = None
           nextEnd = None
           growthDir = None
 
-          # TODO add something here woomp
-          bPos = [b.mEnd.x, b.mEnd.y, b.mEnd.z]
-          lightPos = None
-          isLightBud = False
-          # growthPair = (budPosition, optPt, optGrowthAngle, lightQValue)
+          bStart = store.getStart(b)
+          bEnd = store.getEnd(b)
 
           ''' Check if we have a Light w/ this Bud'''
-          for gPair in self.mOptimalGrowthPairs:
-            gPairPos = [gPair[0].x, gPair[0].y, gPair[0].z]
-            if (bPos == gPairPos):
-              lightPos = OpenMaya.MPoint(gPair[1][0], gPair[1][1], gPair[1][2])
-              isLightBud = True
+          lightPos = lightPoints.get(bEnd)
+          isLightBud = lightPos is not None
 
           ''' Handle Terminal Bud Case '''
-          if b.hasTerminalBud():
+          if state.hasBud(b, STS.BUD_TERMINAL):
             ''' Terminal Buds move along main axis '''
-            terminalBud = b.getTerminalBud()
-            numShoots = int(math.floor(terminalBud.mVResourceAmount))
+            terminalBudV = state.getBudV(b, STS.BUD_COLUMN_TERMINAL)
+            numShoots = int(math.floor(terminalBudV))
             if numShoots > 0:
               # Start Creating additional shoots
-              currentStart = b.mStart
-              currentEnd = b.mEnd
+              currentStart = bStart
+              currentEnd = bEnd
+              parent = b
 
               print ('Appending ', numShoots, ' Terminal shoots!')
-              internodeLength = lengthMultipler * terminalBud.mVResourceAmount / numShoots
+              internodeLength = lengthMultipler * terminalBudV / numShoots
               print ('iLength', internodeLength)
               for j in range(0, numShoots):
                 if isLightBud:
                   '''Case 1: b is a bud w/ a Terminal Bud and light'''
-                  growthDir = SG.normalize(lightPos - currentEnd) * internodeLength
+                  growthDir = SG.normalize([lightPos[0] - currentEnd[0],
+                    lightPos[1] - currentEnd[1], lightPos[2] - currentEnd[2]])
                 else:
                   '''Case 2: b is a bud w/o a Terminal Bud and light'''
-                  growthDir = SG.normalize(currentEnd - currentStart) * internodeLength
+                  growthDir = SG.normalize([currentEnd[0] - currentStart[0],
+                    currentEnd[1] - currentStart[1], currentEnd[2] - currentStart[2]])
+                growthDir = SG.multiplyVectorByScalar(growthDir, internodeLength)
                 # Get start and end of next branch
                 nextStart = currentEnd
-                nextEnd = OpenMaya.MPoint(nextStart.x + growthDir.x,  nextStart.y + growthDir.y, nextStart.z + growthDir.z)
+                nextEnd = (nextStart[0] + growthDir[0], nextStart[1] + growthDir[1], nextStart[2] + growthDir[2])
 
                 ''' Now append the terminal shoot '''
-                shoot = SC.StemCylinder(nextStart, nextEnd, radius)
-                newShoots.append(shoot)
+                parent = store.appendInternode(nextStart, nextEnd, parent)
 
                 # Now set the start to be the newEnd
                 currentStart = nextStart
@@ -510,27 +560,29 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
                 # print 'appended terminal bud'
 
               # Clear the Terminal Bud
-              b.setTerminalBud(None)
+              state.clearBud(b, STS.BUD_TERMINAL, STS.BUD_COLUMN_TERMINAL)
 
 
           ''' Handle Lateral Bud Case '''
-          if b.hasLateralBud():
+          if state.hasBud(b, STS.BUD_LATERAL):
             ''' Lateral Buds move in baseGrownAngle direction '''
-            lateralBud = b.getLateralBud()
-            numShoots = int(math.floor(lateralBud.mVResourceAmount))
+            lateralBudV = state.getBudV(b, STS.BUD_COLUMN_LATERAL)
+            numShoots = int(math.floor(lateralBudV))
             if numShoots > 0:
 
               # Start Creating additional shoots
-              currentStart = b.mStart
-              currentEnd = b.mEnd
+              currentStart = bStart
+              currentEnd = bEnd
+              parent = b
               print ('Appending ', numShoots, ' Lateral shoots!')
-              internodeLength = lengthMultipler * lateralBud.mVResourceAmount / numShoots
+              internodeLength = lengthMultipler * lateralBudV / numShoots
               print ('iLength', internodeLength)
               for j in range(0, numShoots):
                 # L = v / n
                 if isLightBud:
                   '''Case 3: b is a bud w/ a Lateral Bud and light'''
-                  growthDir = SG.normalize(lightPos - currentEnd) * internodeLength
+                  growthDir = SG.normalize([lightPos[0] - currentEnd[0],
+                    lightPos[1] - currentEnd[1], lightPos[2] - currentEnd[2]])
                 else:
                   '''Case 4: b is a bud w/o a Lateral Bud and light'''
 
@@ -538,39 +590,28 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
                   theta = random.randint(minGrowthAngle, maxGrowthAngle) * SG.DEG_2_RAD
                   phi = random.randint(minGrowthAngle, maxGrowthAngle) * SG.DEG_2_RAD
                   psi =  random.randint(minGrowthAngle, maxGrowthAngle) * SG.DEG_2_RAD
-                  growthDir = SG.normalize(OpenMaya.MPoint(theta, phi, psi)) * internodeLength
+                  growthDir = SG.normalize([theta, phi, psi])
+                growthDir = SG.multiplyVectorByScalar(growthDir, internodeLength)
 
                 # Get start and end of next branch
                 nextStart = currentEnd
-                nextEnd = OpenMaya.MPoint(nextStart.x + growthDir.x,  nextStart.y + growthDir.y, nextStart.z + growthDir.z)
+                nextEnd = (nextStart[0] + growthDir[0], nextStart[1] + growthDir[1], nextStart[2] + growthDir[2])
 
                 ''' Now append the lateral shoot '''
-                shoot = SC.StemCylinder(nextStart, nextEnd, radius)
-                newShoots.append(shoot)
+                parent = store.appendInternode(nextStart, nextEnd, parent)
 
                 # Now set the start to be the newEnd
                 currentStart = nextStart
                 currentEnd = nextEnd
-                b.setLateralBud(None)
-
-
-        # Combine new shoots
-        grownTree = preBudGrowthInternodes + newShoots
+              state.clearBud(b, STS.BUD_LATERAL, STS.BUD_COLUMN_LATERAL)
 
-        # Parent all the shoots
-        grownTree = self.createParentChildInternodeHeirarchy(grownTree)
-
-        # Store the iternodes for this iteration
-        if i == growthIters:
-          self.mTreeGrowthInternodes[growthKey] = self.copyInternodes(grownTree)
-
-        # Set up internodes for the next growth iteration
-        preBudGrowthInternodes =  grownTree
+        # Log the tree after this iteration
+        growthLog.endIteration()
 
     #### End growth lopp interation
     ''' Now finish drawing the mesh '''
-    # Set up internodes for drawing
-    self.mInternodes = self.mTreeGrowthInternodes.get(growthKey)
+    # Set up internodes for drawing, a view of the log needs no copy
+    self.mInternodes = growthLog.getView(growthIters)
 
     ''' Now update the growth mesh using the current internodes '''
     # If we use tree curves, update the tree mesh
@@ -583,55 +624,79 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       self.createCylinderMesh(self.mInternodes, data)
 
 
-  '''
-  '' DEEP Copies a list of internodes
-  '''
-  def copyInternodes(self, internodes):
-    internodesCopy = []
-    for b in internodes:
-      internode = b.makeCopy()
-      internodesCopy.append(internode)
-
-    internodesCopy = self.createParentChildInternodeHeirarchy(internodesCopy)
-    return internodesCopy
-
-
-
   '''
   '' Initializes the LSystem and creates the base branches and flowers for the
   '' Stem Instance Node
   '''
   def initLSystemBaseTree(self, iters, angle, step, grammarFile):
-    # Get Grammar File Contents & load to lsys
+    # Get Grammar File Contents. Nothing on the node changes until the new
+    # base tree is accepted.
     if grammarFile != self.mPrevGrammarFile:
-      self.mPrevGrammarContent = self.readGrammarFile(grammarFile)
-      self.mPrevGrammarFile = grammarFile
-
-    grammarContent = self.mPrevGrammarContent
+      grammarContent = self.readGrammarFile(grammarFile)
+    else:
+      grammarContent = self.mPrevGrammarContent
 
     if len(grammarContent) == 0:
       print "Invalid Grammar File!"
+      self.clearTreeOutput()
       return None
 
+    # Only a new grammar needs deriving again, angle and step only affect
+    # the turtle. It is loaded into a new LSystem, which replaces this node's
+    # one once the size check passes.
+    lsystem = self.mLSystem
+    isNewGrammar = grammarContent != lsystem.getGrammarString()
+    if isNewGrammar:
+      lsystem = LSystem.LSystem()
+      lsystem.loadProgramFromString(grammarContent)
+
+    # Check the size of the tree before deriving it, if it can be predicted
+    predictedBytes = self.predictBaseTreeBytes(lsystem, iters)
+    if predictedBytes is None:
+      predictedBytes = 0
+    predictedMB = predictedBytes / (1024 * 1024)
+    if predictedBytes > SG.LSYSTEM_MAX_BYTES:
+      cmds.warning("LSystem too large: %d iterations need about %d MB (limit %d MB)" % (
+        iters, predictedMB, SG.LSYSTEM_MAX_BYTES / (1024 * 1024)))
+      self.clearTreeOutput()
+      return None
+    elif predictedBytes > SG.LSYSTEM_WARN_BYTES:
+      print "Warning: %d iterations need about %d MB" % (iters, predictedMB)
+
+    self.mLSystem = lsystem
+    self.mPrevGrammarFile = grammarFile
+    self.mPrevGrammarContent = grammarContent
+    if isNewGrammar:
+      # Print contents
+      print "Grammar File: " + grammarFile
+      print "Grammar File Contents: " + self.mLSystem.getGrammarString()
+
     # Init the LSystem from the parameters
     self.mLSystem.setDefaultAngle(float(angle))
     self.mLSystem.setDefaultStep(float(step))
-    self.mLSystem.loadProgramFromString(grammarContent)
     #self.mLSystem.setHasResources(hasResources)
 
-    # Print contents
-    print "Grammar File: " + grammarFile
-    print "Grammar File Contents: " + self.mLSystem.getGrammarString()
-
-    # The branches and flowers objects
-    self.mBaseBranches = LSystem.VectorPyBranch()
-    self.mBaseFlowers = LSystem.VectorPyBranch()
-
     # Run Grammar String to make branches and flowers
-    self.mLSystem.processPy(iters, self.mBaseBranches, self.mBaseFlowers)
+    if SG.hasNumpy() and self.hasLSystemMethod('processBuffers'):
+      # Contiguous (N x 6) branches and (M x 3) flowers, viewed without copying
+      self.mLSystem.processBuffers(iters)
+      self.mBaseBranches = SG.wrapFloatBuffer(self.mLSystem.getBranchBufferView(), 6)
+      self.mBaseFlowers = SG.wrapFloatBuffer(self.mLSystem.getFlowerBufferView(), 3)
+      self.mBaseParents = SG.wrapIntBuffer(self.mLSystem.getBranchParentsView())
+    else:
+      self.mBaseBranches = LSystem.VectorPyBranch()
+      self.mBaseFlowers = LSystem.VectorPyBranch()
+      self.mLSystem.processPy(iters, self.mBaseBranches, self.mBaseFlowers)
+      self.mBaseParents = None
+      if self.hasLSystemMethod('getBranchParents'):
+        self.mBaseParents = self.mLSystem.getBranchParents()
+    self.mBaseBounds = None
+    if self.hasLSystemMethod('getBoundsBuffer'):
+      self.mBaseBounds = self.mLSystem.getBoundsBuffer()
 
     self.mPrevIterations = iters
     self.mPrevAngle = angle
+    self.mPrevStep = step
 
 
     # Clear the tree growth meshes
@@ -640,7 +705,20 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
     return [self.mBaseBranches, self.mBaseFlowers]
 
   '''
-  '' Create the cylinder mesh for this StemInstanceNode
+  '' Predicts the memory the base tree of an LSystem needs for iters from the
+  '' production counts of its grammar, without deriving it. None if the
+  '' LSystem bindings cannot predict.
+  '''
+  def predictBaseTreeBytes(self, lsystem, iters):
+    if not self.hasLSystemMethod('predictLength'):
+      return None
+    length = lsystem.predictLength(iters)
+    branches = lsystem.predictBranchCount(iters)
+    flowers = lsystem.predictFlowerCount(iters)
+    return length + branches * SG.LSYSTEM_BYTES_PER_BRANCH + flowers * SG.LSYSTEM_BYTES_PER_FLOWER
+
+  '''
+  '' Create the cylinder mesh for this StemInstanceNode from a StemTreeView
   '''
   def createCylinderMesh(self, internodes, data):
     # Get output objects
@@ -657,7 +735,11 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
     cFaceConnects = OpenMaya.MIntArray()
 
     # Make tree from Internode Cylinder Meshes
-    for cyl in internodes:
+    for b in xrange(len(internodes)):
+      start = internodes.getStart(b)
+      end = internodes.getEnd(b)
+      cyl = SC.StemCylinder(OpenMaya.MPoint(start[0], start[1], start[2]),
+        OpenMaya.MPoint(end[0], end[1], end[2]))
       # Append the Cylinder's mesh to our main mesh
       cyl.appendToMesh(cPoints, cFaceCounts, cFaceConnects)
 
@@ -687,71 +769,37 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
 
 
   '''
-  '' Creates an Internodes List of CylinderMeshes from branches
+  '' Gets the traversal orders of the tree in a store, taking in the internodes
+  '' appended since the last call
   '''
-  def createInternodes(self, branches, flowers):
-    internodes = []
-    for i in range(0, branches.size()):
-      b = branches[i]
-      # Get points
-      start = OpenMaya.MPoint(b[0], b[1], b[2])
-      end = OpenMaya.MPoint(b[3], b[4], b[5])
-      radius = 0.25
-
-      # Create a cylinder from the end points
-      cyMesh = SC.StemCylinder(start, end, radius)
-      internodes.append(cyMesh)
-
-    # Create parent/child heirarchy
-    internodes = self.createParentChildInternodeHeirarchy(internodes)
-
-    # Return the internodes
-    return internodes
-
-
-  '''
-  '' Create Internode Parent Child Heirarchy
-  '''
-  def createParentChildInternodeHeirarchy(self, internodes, shouldReset=True):
-    if shouldReset:
-      internodes = self.resetParentChildInternodeHeirarchy(internodes)
-    for iBranch in internodes:
-      for jBranch in internodes:
-        if iBranch.mEnd == jBranch.mStart:
-          iBranch.mInternodeChildren.append(jBranch)
-          jBranch.mInternodeParent = iBranch
-    return internodes
-
-  '''
-  '' Reset ParentChildInternodeHeirarchy
-  '''
-  def resetParentChildInternodeHeirarchy(self, internodes):
-    for branch in internodes:
-      # Clear parents
-      branch.mInternodeParent = None
-      # Clear Children
-      branch.mInternodeChildren[:] = []
-    return internodes
+  def getTreeTopology(self, store):
+    topology = self.mTreeTopology
+    if topology is None or topology.mStore is not store:
+      topology = STT.StemTreeTopology(store)
+      self.mTreeTopology = topology
+    else:
+      topology.update()
+    return topology
 
   '''
   '' Compute Optimal Growth Pairs
   '''
-  def updateOptimalGrowthPairs(self, internodes):
+  def updateOptimalGrowthPairs(self, store):
     # Get optimal growth pairs and send to LSystem
-    self.mOptimalGrowthPairs = self.computeBudOptimalGrowthDirs(internodes)
+    self.mOptimalGrowthPairs = self.computeBudOptimalGrowthDirs(store)
     return self.mOptimalGrowthPairs
 
   '''
   '' Finds the optimal growth direction angles and their bud growth pairs for
   '' each bud in the tree
   '''
-  def computeBudOptimalGrowthDirs(self, internodes):
+  def computeBudOptimalGrowthDirs(self, store):
     # Erase old curves
     self.eraseCurves(self.mOptCurves)
     self.mOptCurves = []
 
     # Get list of buds in the scence
-    buds = self.createBudList(internodes)
+    buds = self.createBudList(store)
 
     # If Buds is empty, we want to use the StemInstanceLocation as the only bud
     # position (it acts as a root)
@@ -759,8 +807,8 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       # TODO: Figure out how to get this stemInstanceNode's maya name from
       # within this class
       # budPosition = SG.getLocatorWorldPosition(None)
-      rootBudPos = OpenMaya.MPoint(0, 0, 0)
-      buds = [SC.StemCylinder(rootBudPos, rootBudPos)]
+      rootBudPos = (0.0, 0.0, 0.0)
+      buds = [(-1, rootBudPos)]
 
     # Get list of resource noces
     resNodes = self.getSceneResourceNodes()
@@ -785,8 +833,8 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
         continue
 
       # Calculate the weighted average growth direction
-      budPosition = bud.mEnd
-      budCurveWorldPosition = bud.mEnd
+      budInternode, budPosition = bud
+      budCurveWorldPosition = budPosition
       if stemNode != None:
         # Get world position of mEnd (relative to StemInstanceTransform)
         worldPos = SG.getLocatorWorldPosition(stemNode)
@@ -809,7 +857,8 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       # print 'LightValue:', lightQValue
 
       # Set the light for the bud node
-      bud.mInitialQ = lightQValue
+      if budInternode >= 0:
+        store.mState.mInitialQ[budInternode] = lightQValue
       # TODO: Use avg light power for lightQValue
       avgLightPower = totalLightPower / numNodes
 
@@ -845,19 +894,16 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
     return optimalGrowthPairs
 
   '''
-  '' Creates a list of buds based on this instanceNode's internode list
+  '' Creates a list of buds based on this instanceNode's tree store, as
+  '' (internode, position) pairs
   '' Returns an empty array if no buds are present
   '''
-  def createBudList(self, internodes):
+  def createBudList(self, store):
     # Creates a list of buds based on the internodes list-
     # A bud is defined as the end point of an internode that has no children
-    if internodes is None or len(internodes) is 0:
+    if store is None or len(store) is 0:
       return []
-    childBuds = []
-    for n in internodes:
-      if n.mInternodeChildren is None or len(n.mInternodeChildren) == 0:
-        childBuds.append(n)
-    return childBuds
+    return [(b, store.getEnd(b)) for b in self.getTreeTopology(store).mLeaves]
 
   '''
   '' Creates a bud to resource node adjacency list where each bud is associated
@@ -879,7 +925,7 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       # Search through the list of buds and find the closest bud
       for b in buds:
         # Get distance between bud and resNode
-        currentDist = SG.getDistance(b.mEnd, nPos)
+        currentDist = SG.getDistance(b[1], nPos)
 
         # Update optimal bud if necessary
         if currentDist < minDist:
@@ -917,29 +963,54 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
   '''
   '' Configures branches to hand lateral and terminal buds
   '''
-  def configureBudInternodeHeirarchy(self, internodes):
+  def configureBudInternodeHeirarchy(self, store):
     # Create and configure buds and internode heirarchy
-    for b in internodes:
-      if (len(b.mInternodeChildren) == 0):
-        # b.mQLightAmount = 1
-        parent = b
-        b.mBudTerminal = SB.StemBud(SB.BudType.TERMINAL, parent)
-        b.mBudTerminal.mQLightAmount = b.mInitialQ
-        b.mBudLateral = SB.StemBud(SB.BudType.LATERAL, parent)
-        b.mBudLateral.mQLightAmount = b.mInitialQ
-      elif (len(b.mInternodeChildren) == 1):
-        parent = b
-        child = b.mInternodeChildren[0]
-        b.mBudLateral = SB.StemBud(SB.BudType.LATERAL, parent, child)
-        b.mBudLateral.mQLightAmount =  b.mInitialQ
-      else:
-        # Added this to reset the internodes buds when necessary
-        #b.mBudLateral = None
-        #b.mBudTerminal = None
-        b.mInitialQ = 0
-        numChildren = len(b.mInternodeChildren)
-        if numChildren > 2:
-          print "has more than 1 child: " + str(numChildren)
+    topology = self.getTreeTopology(store)
+    state = store.mState
+    if SG.hasNumpy():
+      np = SG.np
+      flags = STS.wrapArray(state.mBudFlags)
+      budQ = STS.wrapArray(state.mBudQ, 2)
+      budV = STS.wrapArray(state.mBudV, 2)
+      initialQ = STS.wrapArray(state.mInitialQ)
+      leaves = np.array(topology.mLeaves, dtype=np.int32)
+      flags[leaves] = STS.BUD_TERMINAL | STS.BUD_LATERAL
+      budQ[leaves] = initialQ[leaves, None]
+      budV[leaves] = 0
+      singles = np.array(topology.mSingleChildInternodes, dtype=np.int32)
+      flags[singles] |= STS.BUD_LATERAL
+      budQ[singles, STS.BUD_COLUMN_LATERAL] = initialQ[singles]
+      budV[singles, STS.BUD_COLUMN_LATERAL] = 0
+      # Added this to reset the internodes buds when necessary
+      initialQ[np.array(topology.mBranchingInternodes, dtype=np.int32)] = 0
+    else:
+      for b in topology.mLeaves:
+        state.setBud(b, STS.BUD_TERMINAL, STS.BUD_COLUMN_TERMINAL, state.mInitialQ[b])
+        state.setBud(b, STS.BUD_LATERAL, STS.BUD_COLUMN_LATERAL, state.mInitialQ[b])
+      for b in topology.mSingleChildInternodes:
+        state.setBud(b, STS.BUD_LATERAL, STS.BUD_COLUMN_LATERAL, state.mInitialQ[b])
+      for b in topology.mBranchingInternodes:
+        state.mInitialQ[b] = 0.0
+    for b in topology.mBranchingInternodes:
+      numChildren = store.mChildCount[b]
+      if numChildren > 2:
+        print "has more than 1 child: " + str(numChildren)
+
+  '''
+  '' Gets the internodes holding a bud with enough resource (V) for at least
+  '' one shoot, in store order
+  '''
+  def getGrowingBudInternodes(self, store):
+    state = store.mState
+    if SG.hasNumpy():
+      flags = STS.wrapArray(state.mBudFlags)
+      budV = STS.wrapArray(state.mBudV, 2)
+      grows = ((flags & STS.BUD_TERMINAL) != 0) & (budV[:, STS.BUD_COLUMN_TERMINAL] >= 1)
+      grows |= ((flags & STS.BUD_LATERAL) != 0) & (budV[:, STS.BUD_COLUMN_LATERAL] >= 1)
+      return SG.np.nonzero(grows)[0].tolist()
+    return [b for b in xrange(len(store))
+      if (state.hasBud(b, STS.BUD_TERMINAL) and state.getBudV(b, STS.BUD_COLUMN_TERMINAL) >= 1)
+      or (state.hasBud(b, STS.BUD_LATERAL) and state.getBudV(b, STS.BUD_COLUMN_LATERAL) >= 1)]
 
   '''
   '' Converts optimal growth pairs into vectors for the LSystem
@@ -973,6 +1044,28 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
 
     return [buds, dirs, angles]
 
+  '''
+  '' Sends the optimal growth pairs to the LSystem, as three flat float32
+  '' buffers when NumPy is available
+  '''
+  def sendOptGrowthPairsToLSystem(self, optimalGrowthPairs):
+    if not SG.hasNumpy() or not self.hasLSystemMethod('setOptimalBudBuffers'):
+      [buds, dirs, angles] = self.convertOptGrowthPairsForLSystem(optimalGrowthPairs)
+      self.mLSystem.setOptimalBudDirs(buds, dirs, angles)
+      return
+
+    count = len(optimalGrowthPairs)
+    buds = SG.np.empty((count, 3), dtype=SG.np.float32)
+    dirs = SG.np.empty((count, 3), dtype=SG.np.float32)
+    angles = SG.np.empty(count, dtype=SG.np.float32)
+    for i, pair in enumerate(optimalGrowthPairs):
+      b = pair[0]
+      d = pair[1]
+      buds[i] = (b[0], b[1], b[2])
+      dirs[i] = (d[0], d[1], d[2])
+      angles[i] = pair[2]
+    self.mLSystem.setOptimalBudBuffers(buds, dirs, angles)
+
   '''
   '' Verifies the output passed to the LSystem
   '' Where <buds> and <angles> are sent to the LSystem and
@@ -1024,161 +1117,165 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
   def getStemNode(self):
     return self.mStemNode
 
-  '''
-  '' Returns the root internode of the Stem tree
-  '''
-  def getRootInternode(self, internodes):
-    if len(internodes) == 0:
-      return None
-    for n in internodes:
-      if n.mInternodeParent is None:
-        return n
-    return None
-
-  '''
-  ''  Performs a BFS traversal from the root and pushes each node
-  ''  onto a stack along the way, returning a list in BFS order.
-  ''  Can be used to get reverse order traversal.
-  '''
-  def getBfsTraversal(self, root):
-    if root is None:
-      return []
-
-    queue = deque([root])
-    stack = []
-
-    while len(queue) > 0:
-      b = queue.popleft()
-      queue.extend(b.mInternodeChildren)
-      stack.append(b)
-
-    return stack
-
   '''
   ''  Distributes amount of resource (v) from a single internode to its children
-  ''  using given equations. Currently assumes first child is m and second is l
-  '''
-  def distributeSingleResource(self, internode):
-    if (internode is None):
-      return
-
-    pV = internode.mVResourceAmount
-
-    if (len(internode.mInternodeChildren) == 0):
-      # if 0 children, there is 1 terminal and 1 lateral bud to split the resource
-      mTarget = internode.mBudTerminal
-      lTarget = internode.mBudLateral
-      pQm = mTarget.mQLightAmount
-      pQl = lTarget.mQLightAmount
-      # Compute amount of resource distributed to axis branch and lateral branch
-      denom = (BH_LAMBDA*pQm + (1-BH_LAMBDA)*pQl)
-      if denom == 0:
-        pVm = 0
-        pVl = 0
-      else:
-        pVm = pV * (BH_LAMBDA * pQm) / denom
-        pVl = pV * ((1-BH_LAMBDA)*pQl) / denom
-      # Distribute
-      mTarget.mVResourceAmount = pVm
-      lTarget.mVResourceAmount = pVl
-
-    elif (len(internode.mInternodeChildren) == 1):
-      # if 1 child, there is 1 internode and 1 lateral bud to split the resource
-      mTarget = internode.mInternodeChildren[0]
-      lTarget = internode.mBudLateral
-      pQm = mTarget.mQLightAmount
-      pQl = lTarget.mQLightAmount
-      # Compute amount of resource distributed to axis branch and lateral branch
-      denom = (BH_LAMBDA*pQm + (1-BH_LAMBDA)*pQl)
-      if denom == 0:
-        pVm = 0
-        pVl = 0
-      else:
-        pVm = pV * (BH_LAMBDA * pQm) / denom
-        pVl = pV * ((1-BH_LAMBDA)*pQl) / denom
-      # Distribute
-      mTarget.mVResourceAmount = pVm
-      lTarget.mVResourceAmount = pVl
-
+  ''  using given equations. The main target is the terminal bud or the first
+  ''  child, the lateral target the lateral bud or the second child.
+  '''
+  def distributeSingleResource(self, store, internode):
+    state = store.mState
+    numChildren = store.mChildCount[internode]
+    mChild = store.mFirstChild[internode]
+    lChild = -1
+    if numChildren > 1:
+      lChild = store.mNextSibling[mChild]
+    mBud = 2 * internode + STS.BUD_COLUMN_TERMINAL
+    lBud = 2 * internode + STS.BUD_COLUMN_LATERAL
+
+    pV = state.mV[internode]
+    pQm = state.mQ[mChild] if numChildren > 0 else state.mBudQ[mBud]
+    pQl = state.mQ[lChild] if numChildren > 1 else state.mBudQ[lBud]
+    # Compute amount of resource distributed to axis branch and lateral branch
+    denom = (BH_LAMBDA*pQm + (1-BH_LAMBDA)*pQl)
+    if denom == 0:
+      pVm = 0
+      pVl = 0
     else:
-      # TODO: still need to determine which is along main axis and which isn't
-      mTarget = internode.mInternodeChildren[0]
-      lTarget = internode.mInternodeChildren[1]
-      pQm = mTarget.mQLightAmount
-      pQl = lTarget.mQLightAmount
-      # Compute amount of resource distributed to axis branch and lateral branch
-      denom = (BH_LAMBDA*pQm + (1-BH_LAMBDA)*pQl)
-      if denom == 0:
-        pVm = 0
-        pVl = 0
-      else:
-        pVm = pV * (BH_LAMBDA * pQm) / denom
-        pVl = pV * ((1-BH_LAMBDA)*pQl) / denom
-      # Distribute
-      mTarget.mVResourceAmount = pVm
-      lTarget.mVResourceAmount = pVl
+      pVm = pV * (BH_LAMBDA * pQm) / denom
+      pVl = pV * ((1-BH_LAMBDA)*pQl) / denom
+    # Distribute
+    if numChildren > 0:
+      state.mV[mChild] = pVm
+    else:
+      state.mBudV[mBud] = pVm
+    if numChildren > 1:
+      state.mV[lChild] = pVl
+    else:
+      state.mBudV[lBud] = pVl
 
   '''
-  ''  Propogates light amounts (Q) from outermost internodes to towards the base.
+  ''  Propogates light amounts (Q) from outermost internodes to towards the base,
+  ''  given the BFS levels of the tree's root
   ''  (TODO: May have to edit to grab the light information from buds themselves)
   '''
-  def performBasipetalPass(self, internodes):
-    root = self.getRootInternode(internodes) #self.getRootInternode()
-    branchStack = self.getBfsTraversal(root)
-
-    # TODO: remove later. this bit is for testing on simple case
-    # currently configuring appropriate bud types and locations using the
-    # given geometry from the LSystem
+  def performBasipetalPass(self, store, levels):
+    state = store.mState
+    q = state.mQ
+    budQ = state.mBudQ
+    parents = store.mParent
 
-    # newList = list(branchStack)
     # for each internode, propogate light information from leaf nodes towards base
-    while (len(branchStack) > 0):
-      b = branchStack.pop()
-      # if the internode has buds with Q values, store cum Q values in internode
-      if (b.mBudTerminal is not None):
-        b.mQLightAmount += b.mBudTerminal.mQLightAmount
-      if (b.mBudLateral is not None):
-        b.mQLightAmount += b.mBudLateral.mQLightAmount
-      # if internode parent stores Q value, also store that in internode
-      if (b.mInternodeParent is not None):
-        b.mInternodeParent.mQLightAmount += b.mQLightAmount
-
-    # TODO: remove later. prints light values after propogation in BFS order
-    # for b in newList:
-    #   print b.mQLightAmount
+    for level in reversed(levels):
+      for b in reversed(level):
+        # if the internode has buds with Q values, store cum Q values in internode
+        if state.hasBud(b, STS.BUD_TERMINAL):
+          q[b] += budQ[2 * b + STS.BUD_COLUMN_TERMINAL]
+        if state.hasBud(b, STS.BUD_LATERAL):
+          q[b] += budQ[2 * b + STS.BUD_COLUMN_LATERAL]
+        # if internode parent stores Q value, also store that in internode
+        if parents[b] >= 0:
+          q[parents[b]] += q[b]
 
   '''
   ''  Distributes resource acropetally between continuing main axes
-  ''  and lateral branches throughout entire tree.
+  ''  and lateral branches throughout entire tree, given the BFS levels of the
+  ''  tree's root
   '''
-  def performAcropetalPass(self, internodes):
+  def performAcropetalPass(self, store, levels):
     # v_base = alpha * Q_base
-    #root = self.getRootInternode()
-    root = self.getRootInternode(internodes)
-    vBase = BH_ALPHA * root.mQLightAmount
-    root.mVResourceAmount = vBase
-    bfsTraversal = self.getBfsTraversal(root)
-    # newList = list(bfsTraversal)
+    state = store.mState
+    root = levels[0][0]
+    state.mV[root] = BH_ALPHA * state.mQ[root]
 
     # Distribute resource acropetally (from base upwards)
-    for b in bfsTraversal:
-      self.distributeSingleResource(b)
-
-    # TODO: remove later. prints resource values in BFS order
-    # for b in newList:
-    #   print b.mVResourceAmount
+    for level in levels:
+      for b in level:
+        self.distributeSingleResource(store, b)
 
   '''
   ''  Performs BH Model passes to distribute resources throught the tree.
   '''
-  def performBHModelResourceDistribution(self, internodes):
+  def performBHModelResourceDistribution(self, store):
     if ENABLE_JUDYS_DEBUG_PRINTING_CRAP:
       print "===================================================================="
       print "PERFORMING RESOURCE DISTRIBUTION===================================="
       print "===================================================================="
-    #self.clearBudResourceData(internodes)
-    self.performBasipetalPass(internodes)
-    self.performAcropetalPass(internodes)
+    #self.clearBudResourceData(store)
+    levels = self.getTreeTopology(store).mLevels
+    if len(levels) == 0:
+      return
+    if SG.hasNumpy():
+      self.performBasipetalPassWithNumpy(store, levels)
+      self.performAcropetalPassWithNumpy(store, levels)
+      return
+    self.performBasipetalPass(store, levels)
+    self.performAcropetalPass(store, levels)
+
+  '''
+  ''  Array version of performBasipetalPass. Each level adds its bud Q values
+  ''  and then passes its Q on to the parents, deepest level first.
+  '''
+  def performBasipetalPassWithNumpy(self, store, levels):
+    np = SG.np
+    state = store.mState
+    q = STS.wrapArray(state.mQ)
+    budQ = STS.wrapArray(state.mBudQ, 2)
+    flags = STS.wrapArray(state.mBudFlags)
+    parents = STS.wrapArray(store.mParent)
+    hasTerminal = (flags & STS.BUD_TERMINAL) != 0
+    hasLateral = (flags & STS.BUD_LATERAL) != 0
+    for level in reversed(levels):
+      # Reversed, so the children of a parent add up in the same order as
+      # performBasipetalPass
+      level = STS.wrapArray(level)[::-1]
+      q[level] += np.where(hasTerminal[level], budQ[level, STS.BUD_COLUMN_TERMINAL], 0)
+      q[level] += np.where(hasLateral[level], budQ[level, STS.BUD_COLUMN_LATERAL], 0)
+      levelParents = parents[level]
+      hasParent = levelParents >= 0
+      np.add.at(q, levelParents[hasParent], q[level[hasParent]])
+
+  '''
+  ''  Array version of performAcropetalPass. Each level splits its V between
+  ''  the main and the lateral target like distributeSingleResource.
+  '''
+  def performAcropetalPassWithNumpy(self, store, levels):
+    np = SG.np
+    state = store.mState
+    q = STS.wrapArray(state.mQ)
+    v = STS.wrapArray(state.mV)
+    budQ = STS.wrapArray(state.mBudQ, 2)
+    budV = STS.wrapArray(state.mBudV, 2)
+    counts = STS.wrapArray(store.mChildCount)
+    firstChildren = STS.wrapArray(store.mFirstChild)
+    nextSiblings = STS.wrapArray(store.mNextSibling)
+
+    root = levels[0][0]
+    v[root] = BH_ALPHA * q[root]
+    for level in levels:
+      level = STS.wrapArray(level)
+      hasMain = counts[level] >= 1
+      hasLateral = counts[level] >= 2
+      mainChildren = firstChildren[level[hasMain]]
+      lateralChildren = nextSiblings[firstChildren[level[hasLateral]]]
+
+      pQm = budQ[level, STS.BUD_COLUMN_TERMINAL]
+      pQm[hasMain] = q[mainChildren]
+      pQl = budQ[level, STS.BUD_COLUMN_LATERAL]
+      pQl[hasLateral] = q[lateralChildren]
+
+      # Compute amount of resource distributed to axis branch and lateral branch
+      denom = (BH_LAMBDA*pQm + (1-BH_LAMBDA)*pQl)
+      isSplit = denom != 0
+      denom[~isSplit] = 1
+      pV = v[level]
+      pVm = np.where(isSplit, pV * (BH_LAMBDA * pQm) / denom, 0)
+      pVl = np.where(isSplit, pV * ((1-BH_LAMBDA)*pQl) / denom, 0)
+
+      # Distribute
+      budV[level[~hasMain], STS.BUD_COLUMN_TERMINAL] = pVm[~hasMain]
+      v[mainChildren] = pVm[hasMain]
+      budV[level[~hasLateral], STS.BUD_COLUMN_LATERAL] = pVl[~hasLateral]
+      v[lateralChildren] = pVl[hasLateral]
 
 
   '''
@@ -1268,27 +1365,27 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
       cmds.delete(str(self.mTreeMesh))
 
   '''
-  '' Creates a list of tree curves
+  '' Creates a list of tree curves from a StemTreeView of the internodes, one
+  '' from the root to each leaf
   '''
   def createTreeCurveList(self, internodes):
     # Grab the StemNodeInstance
     worldPos = SG.getLocatorWorldPosition(self.getStemNode())
-    buds = self.createBudList(internodes)
+    offset = (worldPos[0], worldPos[1], worldPos[2])
+
     curves = []
-    for b in buds:
-      curve = []
+    for b in internodes.getLeaves():
       # Add end point of curve
-      cEnd = b.getEndPointTuple()
-      cEnd = (cEnd[0] + worldPos[0], cEnd[1]  + worldPos[1], cEnd[2] + worldPos[2])
-      curve.append(cEnd)
+      cEnd = internodes.getEnd(b)
+      curve = [(cEnd[0] + offset[0], cEnd[1] + offset[1], cEnd[2] + offset[2])]
 
       # Now use Reverse DFS
       parent = b
-      while parent is not None:
-        cStart = parent.getStartPointTuple()
-        cStart = (cStart[0] + worldPos[0], cStart[1]  + worldPos[1], cStart[2] + worldPos[2])
-        curve.insert(0, cStart)
-        parent = parent.mInternodeParent
+      while parent >= 0:
+        cStart = internodes.getStart(parent)
+        curve.append((cStart[0] + offset[0], cStart[1] + offset[1], cStart[2] + offset[2]))
+        parent = internodes.getParent(parent)
+      curve.reverse()
 
       # Add curve to curves list
       curves.append(curve)
@@ -1375,40 +1472,33 @@ class StemInstanceNode(OpenMayaMPx.MPxLocatorNode):
     # Link mesh
     cmds.parent(str(node), txNode)
 
-  def clearBudResourceData(self, internodes):
+  def clearBudResourceData(self, store):
     if ENABLE_JUDYS_DEBUG_PRINTING_CRAP:
       print "!!!CLEARING BUD DATA!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!"
-    for branch in internodes:
-      branch.mQLightAmount = 0
-      branch.mVResourceAmount = 0
-      if branch.hasTerminalBud():
-        tBud = branch.getTerminalBud()
-        tBud.mQLightAmount = 0
-        tBud.mVResourceAmount = 0
-      if branch.hasLateralBud():
-        lBud = branch.getLateralBud()
-        lBud.mQLightAmount = 0
-        lBud.mVResourceAmount = 0
-
-  def drawBuds(self, internodes):
+    state = store.mState
+    for b in xrange(len(state)):
+      state.mQ[b] = 0.0
+      state.mV[b] = 0.0
+      for column in (STS.BUD_COLUMN_TERMINAL, STS.BUD_COLUMN_LATERAL):
+        state.mBudQ[2 * b + column] = 0.0
+        state.mBudV[2 * b + column] = 0.0
+
+  def drawBuds(self, store):
     if ENABLE_JUDYS_DEBUG_PRINTING_CRAP:
       print "====DRAWIN BUDS=================================================="
-    for branch in internodes:
+    state = store.mState
+    for b in xrange(len(store)):
       if ENABLE_JUDYS_DEBUG_PRINTING_CRAP:
         print "====searchin======="
-      if branch.hasTerminalBud():
-        tBud = branch.getTerminalBud()
+      if state.hasBud(b, STS.BUD_TERMINAL):
         txNode = str(cmds.sphere(r=0.05)[0])
-        tBudPos = branch.mEnd
-        # note: tBud.mInternodeParent returns None when it shouldn't on iter=3
-        # issue w/ makeCopy or intentional?
+        tBudPos = store.getEnd(b)
         cmds.move(tBudPos[0]+0.05, tBudPos[1], tBudPos[2], txNode, absolute=True)
         if ENABLE_JUDYS_DEBUG_PRINTING_CRAP:
           print txNode
-      if branch.hasLateralBud():
-        lBud = branch.getLateralBud()
+      if state.hasBud(b, STS.BUD_LATERAL):
         txNode = str(cmds.nurbsCube(w=0.1)[0])
-        tBudPos = branch.mEnd
+        tBudPos = store.getEnd(b)
         cmds.move(tBudPos[0]-0.05, tBudPos[1], tBudPos[2], txNode, absolute=True)
 
 ######################## End StemInstanceNode Class ############################
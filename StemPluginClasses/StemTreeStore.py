@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+import array, math
+import StemGlobal as SG
+
+#------------------------------------------------------------------------------#
+# Struct-of-arrays store of a growing internode tree
+#------------------------------------------------------------------------------#
+
+# Bud state flags
+BUD_TERMINAL = 1
+BUD_LATERAL = 2
+
+# Columns of the bud arrays
+BUD_COLUMN_TERMINAL = 0
+BUD_COLUMN_LATERAL = 1
+
+# Internode end points are matched on a grid of this size when linking
+# parents and children
+LINK_TOLERANCE = 1e-6
+
+# Arrays of a StemTreeState and the number of entries an internode has in
+# each of them
+STATE_ARRAYS = (('mQ', 1), ('mV', 1), ('mInitialQ', 1), ('mBudFlags', 1),
+  ('mBudQ', 2), ('mBudV', 2))
+
+# NumPy types of the array typecodes used by the store
+NUMPY_TYPES = {'d': 'float64', 'i': 'int32', 'b': 'int8'}
+
+'''
+'' Wraps an array of the store as a NumPy array, optionally of rows of width
+'' values, without copying. The NumPy array shares the array's memory, so it
+'' is only valid until the next internode is appended to the store.
+'''
+def wrapArray(values, width=1):
+  np = SG.np
+  if len(values) == 0:
+    view = np.zeros(0, dtype=NUMPY_TYPES[values.typecode])
+  else:
+    view = np.frombuffer(values, dtype=NUMPY_TYPES[values.typecode])
+  if width > 1:
+    view = view.reshape(-1, width)
+  return view
+
+'''
+'' Quantizes a point to a hashable key on the link grid
+'''
+def getPointKey(point):
+  return (int(math.floor(point[0] / LINK_TOLERANCE + 0.5)),
+    int(math.floor(point[1] / LINK_TOLERANCE + 0.5)),
+    int(math.floor(point[2] / LINK_TOLERANCE + 0.5)))
+
+'''
+'' Creates a StemTreeStore from branches given as rows of start and end point
+'' coordinates. parents holds the parent index of every branch as given by
+'' the LSystem, which lists every parent before its children. Without it, the
+'' parent of a branch is the last branch before it that ends where it starts.
+'''
+def createTreeStore(branches, parents=None):
+  # NumPy buffers convert to rows of Python floats in a single call
+  if SG.hasNumpy() and isinstance(branches, SG.np.ndarray):
+    branches = branches.tolist()
+  if SG.hasNumpy() and isinstance(parents, SG.np.ndarray):
+    parents = parents.tolist()
+  if parents is not None and len(parents) != len(branches):
+    parents = None
+
+  store = StemTreeStore()
+  ends = {}
+  for i, b in enumerate(branches):
+    start = (b[0], b[1], b[2])
+    end = (b[3], b[4], b[5])
+    if parents is None:
+      parent = ends.get(getPointKey(start), -1)
+      ends[getPointKey(end)] = i
+    else:
+      parent = parents[i]
+      # Only an earlier branch can be a parent
+      if parent >= i:
+        parent = -1
+    store.appendInternode(start, end, parent)
+  return store
+
+
+'''
+'' The state of the internodes of a tree that growth changes, one entry per
+'' internode:
+''   mQ[i], mV[i]             light (Q) and resource (V) amounts
+''   mInitialQ[i]             Q given to new buds
+''   mBudFlags[i]             BUD_TERMINAL | BUD_LATERAL for the buds it holds
+''   mBudQ[2 * i + column]    Q and V of its buds, by BUD_COLUMN_TERMINAL
+''   mBudV[2 * i + column]    and BUD_COLUMN_LATERAL
+'''
+class StemTreeState:
+
+  '''
+  '' Creates the zeroed state of size internodes
+  '''
+  def __init__(self, size=0):
+    self.mQ = array.array('d', [0.0]) * size
+    self.mV = array.array('d', [0.0]) * size
+    self.mInitialQ = array.array('d', [0.0]) * size
+    self.mBudFlags = array.array('b', [0]) * size
+    self.mBudQ = array.array('d', [0.0]) * (2 * size)
+    self.mBudV = array.array('d', [0.0]) * (2 * size)
+
+  def __len__(self):
+    return len(self.mQ)
+
+  '''
+  '' Adds the zeroed state of a new internode
+  '''
+  def append(self):
+    self.mQ.append(0.0)
+    self.mV.append(0.0)
+    self.mInitialQ.append(0.0)
+    self.mBudFlags.append(0)
+    self.mBudQ.extend((0.0, 0.0))
+    self.mBudV.extend((0.0, 0.0))
+
+  '''
+  '' Makes a copy of the state of the first size internodes, all of them by
+  '' default
+  '''
+  def copy(self, size=None):
+    if size is None:
+      size = len(self)
+    state = StemTreeState()
+    for name, width in STATE_ARRAYS:
+      setattr(state, name, getattr(self, name)[:width * size])
+    return state
+
+  '''
+  '' Gets the entries that differ from an earlier state of the same tree, as
+  '' (array name, indices, old values, new values) for every array with
+  '' changes. Internodes added since then changed from 0.
+  '''
+  def getChanges(self, earlier):
+    changes = []
+    for name, width in STATE_ARRAYS:
+      values = getattr(self, name)
+      earlierValues = getattr(earlier, name)
+      if SG.hasNumpy():
+        np = SG.np
+        current = wrapArray(values)
+        before = np.zeros(len(current), dtype=current.dtype)
+        before[:len(earlierValues)] = wrapArray(earlierValues)
+        indices = np.nonzero(current != before)[0]
+        if len(indices) > 0:
+          changes.append((name, array.array('i', indices.tolist()),
+            array.array(values.typecode, before[indices].tolist()),
+            array.array(values.typecode, current[indices].tolist())))
+        continue
+
+      indices = array.array('i')
+      oldValues = array.array(values.typecode)
+      newValues = array.array(values.typecode)
+      count = len(earlierValues)
+      for i in xrange(len(values)):
+        value = earlierValues[i] if i < count else 0
+        if values[i] != value:
+          indices.append(i)
+          oldValues.append(value)
+          newValues.append(values[i])
+      if len(indices) > 0:
+        changes.append((name, indices, oldValues, newValues))
+    return changes
+
+  '''
+  '' Sets the entries of changes from getChanges to their new values, or back
+  '' to their old ones with undo. Entries past the end of this state are
+  '' skipped.
+  '''
+  def applyChanges(self, changes, undo=False):
+    for name, indices, oldValues, newValues in changes:
+      values = getattr(self, name)
+      source = oldValues if undo else newValues
+      if SG.hasNumpy():
+        target = wrapArray(values)
+        positions = wrapArray(indices)
+        inside = positions < len(target)
+        target[positions[inside]] = wrapArray(source)[inside]
+        continue
+
+      count = len(values)
+      for i, index in enumerate(indices):
+        if index < count:
+          values[index] = source[i]
+
+  '''
+  '' Returns true if an internode holds the bud of a BUD_* flag
+  '''
+  def hasBud(self, node, flag):
+    return (self.mBudFlags[node] & flag) != 0
+
+  '''
+  '' Gets the Q of the bud in a column of an internode
+  '''
+  def getBudQ(self, node, column):
+    return self.mBudQ[2 * node + column]
+
+  '''
+  '' Gets the V of the bud in a column of an internode
+  '''
+  def getBudV(self, node, column):
+    return self.mBudV[2 * node + column]
+
+  '''
+  '' Gives an internode a new bud with the Q amount q and no V
+  '''
+  def setBud(self, node, flag, column, q):
+    self.mBudFlags[node] |= flag
+    self.mBudQ[2 * node + column] = q
+    self.mBudV[2 * node + column] = 0.0
+
+  '''
+  '' Removes a bud from an internode
+  '''
+  def clearBud(self, node, flag, column):
+    self.mBudFlags[node] &= ~flag
+    self.mBudQ[2 * node + column] = 0.0
+    self.mBudV[2 * node + column] = 0.0
+
+
+'''
+'' A tree of internodes kept in flat arrays, which growth appends to. An
+'' internode i has:
+''   mStart[3 * i:3 * i + 3], mEnd[3 * i:3 * i + 3]   end points
+''   mParent[i]               parent internode, -1 at a root
+''   mChildCount[i]           number of children
+''   mFirstChild[i], mLastChild[i]   first and last child, -1 for none
+''   mNextSibling[i]          next child of the same parent, -1 for none
+'' and its entry in mState. A parent always comes before its children, and
+'' the children of an internode are in store order, so a prefix of the
+'' store is a tree too. That is about 130 bytes an internode, against
+'' kilobytes for a StemCylinder with its points, lists and buds.
+'''
+class StemTreeStore:
+
+  def __init__(self):
+    self.mStart = array.array('d')
+    self.mEnd = array.array('d')
+    self.mParent = array.array('i')
+    self.mChildCount = array.array('i')
+    self.mFirstChild = array.array('i')
+    self.mLastChild = array.array('i')
+    self.mNextSibling = array.array('i')
+    self.mState = StemTreeState()
+
+  def __len__(self):
+    return len(self.mParent)
+
+  '''
+  '' Appends an internode from start to end as the last child of parent (-1
+  '' for a root) and returns it
+  '''
+  def appendInternode(self, start, end, parent=-1):
+    node = len(self.mParent)
+    self.mStart.extend(start)
+    self.mEnd.extend(end)
+    self.mParent.append(parent)
+    self.mChildCount.append(0)
+    self.mFirstChild.append(-1)
+    self.mLastChild.append(-1)
+    self.mNextSibling.append(-1)
+    if parent >= 0:
+      if self.mChildCount[parent] == 0:
+        self.mFirstChild[parent] = node
+      else:
+        self.mNextSibling[self.mLastChild[parent]] = node
+      self.mLastChild[parent] = node
+      self.mChildCount[parent] += 1
+    self.mState.append()
+    return node
+
+  '''
+  '' Gets the start point of an internode as a tuple
+  '''
+  def getStart(self, node):
+    i = 3 * node
+    return (self.mStart[i], self.mStart[i + 1], self.mStart[i + 2])
+
+  '''
+  '' Gets the end point of an internode as a tuple
+  '''
+  def getEnd(self, node):
+    i = 3 * node
+    return (self.mEnd[i], self.mEnd[i + 1], self.mEnd[i + 2])
+
+  '''
+  '' Gets the parent of an internode, -1 at a root
+  '''
+  def getParent(self, node):
+    return self.mParent[node]
+
+  '''
+  '' Gets the children of an internode among the first size internodes
+  '''
+  def getChildren(self, node, size=None):
+    if size is None:
+      size = len(self)
+    children = []
+    child = self.mFirstChild[node]
+    while 0 <= child < size:
+      children.append(child)
+      child = self.mNextSibling[child]
+    return children
+
+  '''
+  '' Gets the internodes without children among the first size internodes
+  '''
+  def getLeaves(self, size=None):
+    if size is None:
+      size = len(self)
+    if SG.hasNumpy():
+      firstChild = wrapArray(self.mFirstChild)[:size]
+      return SG.np.nonzero((firstChild < 0) | (firstChild >= size))[0].tolist()
+    firstChild = self.mFirstChild
+    return [n for n in xrange(size) if not 0 <= firstChild[n] < size]
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import array
+import StemGlobal as SG
+import StemTreeStore as STS
+
+#------------------------------------------------------------------------------#
+# Traversal orders of a growing internode tree, kept up to date as it grows
+#------------------------------------------------------------------------------#
+
+'''
+'' The root, BFS levels and node lists of the tree in a StemTreeStore. The
+'' store only grows, so its size is the heirarchy version: an update takes
+'' the internodes appended since the last one into the BFS levels without
+'' walking the tree again.
+'''
+class StemTreeTopology:
+
+  def __init__(self, store):
+    self.mStore = store
+    # Number of internodes of the store taken in so far
+    self.mSize = 0
+
+    # First internode without a parent, None for an empty store
+    self.mRoot = None
+    # BFS depth of every internode below the root. Later roots and the
+    # internodes below them get -1: they are in no level, so both BH passes
+    # skip them.
+    self.mDepth = array.array('i')
+    # Internodes of every BFS level below and including the root, each in
+    # store order. An internode that grows shoots over several iterations
+    # has its children spread out within a level. The resource passes only
+    # need every parent to be on a lower level than its children.
+    self.mLevels = []
+
+    # Internodes without children, with one child and with more, in store
+    # order
+    self.mLeaves = []
+    self.mSingleChildInternodes = []
+    self.mBranchingInternodes = []
+
+    self.update()
+
+  '''
+  '' Takes in the internodes appended to the store since the last update
+  '''
+  def update(self):
+    store = self.mStore
+    size = len(store)
+    if size == self.mSize:
+      return
+
+    parents = store.mParent
+    depths = self.mDepth
+    for node in xrange(self.mSize, size):
+      parent = parents[node]
+      depth = -1
+      if parent >= 0:
+        if depths[parent] >= 0:
+          depth = depths[parent] + 1
+      elif self.mRoot is None:
+        self.mRoot = node
+        depth = 0
+      depths.append(depth)
+      if depth >= 0:
+        if depth == len(self.mLevels):
+          self.mLevels.append(array.array('i'))
+        self.mLevels[depth].append(node)
+    self.mSize = size
+
+    # Appending a child moves its parent between the node lists
+    if SG.hasNumpy():
+      np = SG.np
+      counts = STS.wrapArray(store.mChildCount)
+      self.mLeaves = np.nonzero(counts == 0)[0].tolist()
+      self.mSingleChildInternodes = np.nonzero(counts == 1)[0].tolist()
+      self.mBranchingInternodes = np.nonzero(counts > 1)[0].tolist()
+    else:
+      counts = store.mChildCount
+      self.mLeaves = [n for n in xrange(size) if counts[n] == 0]
+      self.mSingleChildInternodes = [n for n in xrange(size) if counts[n] == 1]
+      self.mBranchingInternodes = [n for n in xrange(size) if counts[n] > 1]
+
+  '''
+  '' Gets the number of BFS levels below and including the root
+  '''
+  def getLevelCount(self):
+    return len(self.mLevels)
+
+  '''
+  '' Gets a BFS level as an array of internodes
+  '''
+  def getLevel(self, level):
+    return self.mLevels[level]